@@ -278,6 +278,10 @@ class FemSettingsDialog:
         prefs.SetBool("UseStandardOpenRadiossStarterLocation", self.get_ui_checked("UseStandardOpenRadiossStarterLocation"))
         prefs.SetBool("UseStandardOpenRadiossAnimToVTKLocation", self.get_ui_checked("UseStandardOpenRadiossAnimToVTKLocation"))
 
+        # The engine binary found with the old settings may not be the one to use now
+        from femtools.runORtools import FemToolsOR
+        FemToolsOR.reset_or_binary_cache()
+
     def load_calculix_settings(self):
         """Load CalculiX settings into UI"""
         from femsolver.settings import get_binary
@@ -143,6 +143,8 @@ class Results(run.Results):
         if not prefs.GetBool("KeepResultsOnReRun", False):
             self.purge_results()
         self.load_results()
+        # the eigenmode index is only needed while loading results
+        self._eig_index = None
 
     def purge_results(self):
         self.pushStatus("Purge existing results...\n")
@@ -160,6 +162,12 @@ class Results(run.Results):
     def load_results(self):
         self.pushStatus("Import new results...\n")
         self.load_ccxfrd_results()
+        # index eigenmode result objects once, right after the frd import created them
+        self._eig_index = {
+            m.Eigenmode: m
+            for m in membertools.get_member(self.analysis, "Fem::FemResultObject")
+            if getattr(m, "Eigenmode", 0) > 0
+        }
         self.load_ccxdat_results()
 
     def load_ccxfrd_results(self):
@@ -185,12 +193,20 @@ class Results(run.Results):
             self.fail()
         if mode_frequencies:
             FreeCAD.Console.PrintMessage(f"DEBUG: Processing {len(mode_frequencies)} eigenmodes\n")
-            for m in membertools.get_member(self.analysis, "Fem::FemResultObject"):
-                if m.Eigenmode > 0:
-                    for mf in mode_frequencies:
-                        if m.Eigenmode == mf["eigenmode"]:
-                            m.EigenmodeFrequency = mf["frequency"]
-                            FreeCAD.Console.PrintMessage(f"DEBUG: Set frequency for mode {m.Eigenmode}\n")
+            for mf in mode_frequencies:
+                m = self._eig_index.get(mf["eigenmode"])
+                if m is not None:
+                    m.EigenmodeFrequency = mf["frequency"]
+                    FreeCAD.Console.PrintMessage(f"DEBUG: Set frequency for mode {m.Eigenmode}\n")
+
+
+# (widget name, solver property, default value) shown in the task panel
+_FIELDS = (
+    ("sb_eigenmodes", "EigenmodesCount", 10),
+    ("sb_cycles", "IterationsMaximum", 1000),
+    ("dsb_time_step", "TimeStep", 1.0),
+    ("dsb_time_end", "TimeEnd", 1.0),
+)
 
 
 class _TaskPanel:
@@ -210,25 +226,19 @@ class _TaskPanel:
         
     def setupUi(self):
         """Initialize the UI with current values."""
-        self.form.sb_eigenmodes.setValue(self.obj.Eigenmodes)
-        self.form.sb_cycles.setValue(self.obj.IterationsMaximum)
-        self.form.dsb_time_step.setValue(self.obj.TimeStep)
-        self.form.dsb_time_end.setValue(self.obj.TimeEnd)
+        for widget, attr, _default in _FIELDS:
+            getattr(self.form, widget).setValue(getattr(self.obj, attr))
         
     def edit(self):
         """Handle edit button click."""
-        self.obj.Eigenmodes = self.form.sb_eigenmodes.value()
-        self.obj.IterationsMaximum = self.form.sb_cycles.value()
-        self.obj.TimeStep = self.form.dsb_time_step.value()
-        self.obj.TimeEnd = self.form.dsb_time_end.value()
+        for widget, attr, _default in _FIELDS:
+            setattr(self.obj, attr, getattr(self.form, widget).value())
         FreeCADGui.ActiveDocument.resetEdit()
         
     def reset(self):
         """Reset to default values."""
-        self.form.sb_eigenmodes.setValue(10)
-        self.form.sb_cycles.setValue(1000)
-        self.form.dsb_time_step.setValue(1.0)
-        self.form.dsb_time_end.setValue(1.0)
+        for widget, _attr, default in _FIELDS:
+            getattr(self.form, widget).setValue(default)
     
     @staticmethod
     def unsetEdit():
@@ -1,19 +1,71 @@
 import os
 import json
+from collections import defaultdict
 from PySide import QtGui, QtCore
 from PySide.QtCore import Qt
 
+# Parsed JSON files keyed by path, stored together with the file's mtime
+_JSON_CACHE = {}
+
+
+def _load_json_cached(path):
+    """Return the parsed content of a JSON file, re-parsing only if the file changed.
+
+    Set FEM_KEYWORD_EDITOR_ORJSON=1 to parse with orjson if it is installed.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    data = None
+    if os.environ.get('FEM_KEYWORD_EDITOR_ORJSON'):
+        try:
+            import orjson
+        except ImportError:
+            pass
+        else:
+            with open(path, 'rb') as f:
+                data = orjson.loads(f.read())
+    if data is None:
+        with open(path, 'r') as f:
+            data = json.load(f)
+
+    _JSON_CACHE[path] = (mtime, data)
+    return data
+
+
 class KeywordEditorPanel(QtGui.QWidget):
     """Panel for editing LS-DYNA/OpenRadioss keywords with live configuration."""
     
     def __init__(self):
         super().__init__()
         self.keywords = []
+        # Lowercase keyword names, parallel to self.keywords
+        self._names_lower = []
         self.current_keyword = None
-        self.keyword_widgets = []
+        # Parameter names, their input widgets and their syntax data as
+        # parallel lists
+        self._param_names = []
+        self._param_widgets = []
+        self._param_datas = []
+        # Hidden parameter widgets kept for reuse, keyed by widget class
+        self._widget_pool = {
+            QtGui.QLabel: [],
+            QtGui.QLineEdit: [],
+            QtGui.QComboBox: [],
+            QtGui.QCheckBox: [],
+        }
+        # Lookup tables into the syntax examples, built in load_keywords
+        self._kw_index = {}
+        self._prefix_index = {}
+        # Maps each 3-character substring of a lowercase keyword name to the
+        # indices of the keywords containing it
+        self._trigram_index = defaultdict(set)
         
         self.setup_ui()
-        self.load_keywords()
+        # The keyword data is loaded when the panel is first shown
+        self._keywords_loaded = False
         
     def setup_ui(self):
         """Set up the user interface."""
@@ -30,9 +82,16 @@ class KeywordEditorPanel(QtGui.QWidget):
         # Search box
         self.search_box = QtGui.QLineEdit()
         self.search_box.setPlaceholderText("Search keywords...")
-        self.search_box.textChanged.connect(self.filter_keywords)
         left_layout.addWidget(self.search_box)
         
+        # Debounce the search so fast typing triggers a single list update
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._do_filter)
+        # textChanged passes the text, which must not reach QTimer.start(msec)
+        self.search_box.textChanged.connect(lambda _text: self._filter_timer.start())
+        
         # Category filter
         self.category_combo = QtGui.QComboBox()
         self.category_combo.addItem("All Categories")
@@ -105,42 +164,61 @@ class KeywordEditorPanel(QtGui.QWidget):
                 os.path.dirname(__file__), 
                 "..", "gui", "json", "keywords_clean.json"
             )
-            with open(keywords_path, 'r') as f:
-                all_keywords = json.load(f)
+            all_keywords = _load_json_cached(keywords_path)
             
             # Load syntax configurations
             syntax_path = os.path.join(
                 os.path.dirname(__file__), 
                 "..", "gui", "json", "ls_dyna_syntax_user_friendly.json"
             )
-            with open(syntax_path, 'r') as f:
-                self.syntax_data = json.load(f)
+            self.syntax_data = _load_json_cached(syntax_path)
             
-            # Get list of valid CFD keywords from syntax data
-            valid_cfd_keywords = set()
-            if 'ls_dyna_syntax' in self.syntax_data and 'examples' in self.syntax_data['ls_dyna_syntax']:
-                for example_name, example_data in self.syntax_data['ls_dyna_syntax']['examples'].items():
-                    if 'keyword' in example_data:
-                        valid_cfd_keywords.add(example_data['keyword'])
+            # Index the syntax examples by keyword and by keyword prefix (e.g. MAT_)
+            self._kw_index = {}
+            self._prefix_index = {}
+            examples = self.syntax_data.get('ls_dyna_syntax', {}).get('examples', {})
+            for example_data in examples.values():
+                if 'keyword' not in example_data:
+                    continue
+                kw_name = example_data['keyword']
+                self._kw_index.setdefault(kw_name, example_data)
+                if '_' in kw_name:
+                    self._prefix_index.setdefault(kw_name.split('_', 1)[0] + '_', example_data)
             
-            # Filter keywords to only include those in both sources
+            # Filter keywords to only include those in both sources, collecting
+            # categories and list items in the same pass
             self.keywords = []
+            self._names_lower = []
+            self._trigram_index = defaultdict(set)
+            categories = set()
+            items = []
             for kw in all_keywords:
                 kw_name = kw.get('name', '')
                 # Check if keyword exists in CFD configuration
-                if kw_name in valid_cfd_keywords:
-                    # Also verify it has a valid configuration
-                    if self.get_keyword_config(kw_name) is not None:
-                        self.keywords.append(kw)
-            
-            # Update UI with filtered keywords
-            self.update_keyword_list()
-            
-            # Extract and set categories from filtered keywords
-            categories = set()
-            for kw in self.keywords:
+                if kw_name not in self._kw_index:
+                    continue
+                name_lower = kw_name.lower()
+                for j in range(len(name_lower) - 2):
+                    self._trigram_index[name_lower[j:j + 3]].add(len(self.keywords))
+                self.keywords.append(kw)
+                self._names_lower.append(name_lower)
                 if 'category' in kw:
                     categories.add(kw['category'])
+                item = QtGui.QListWidgetItem(kw_name)
+                item.setData(Qt.UserRole, kw)
+                items.append(item)
+            
+            # Update UI with filtered keywords, as one batch without per-item
+            # signals and repaints
+            self.keyword_list.blockSignals(True)
+            self.keyword_list.setUpdatesEnabled(False)
+            try:
+                self.keyword_list.clear()
+                for item in items:
+                    self.keyword_list.addItem(item)
+            finally:
+                self.keyword_list.blockSignals(False)
+                self.keyword_list.setUpdatesEnabled(True)
             
             # Clear existing items and add new ones
             self.category_combo.clear()
@@ -151,25 +229,58 @@ class KeywordEditorPanel(QtGui.QWidget):
             QtGui.QMessageBox.critical(self, "Error", f"Failed to load keyword data: {str(e)}")
     
     def update_keyword_list(self, filter_text="", category=""):
-        """Update the keyword list based on filter and category."""
-        self.keyword_list.clear()
+        """Update the keyword list based on filter and category.
         
-        for kw in self.keywords:
-            name = kw.get('name', '')
-            kw_category = kw.get('category', '')
-            
-            # Apply filters
-            if filter_text.lower() not in name.lower():
-                continue
-                
-            if category and category != "All Categories" and kw_category != category:
-                continue
-            
-            item = QtGui.QListWidgetItem(name)
-            item.setData(Qt.UserRole, kw)
-            self.keyword_list.addItem(item)
+        The list items are created once in load_keywords; filtering only toggles
+        their visibility.
+        """
+        filter_text = filter_text.lower()
+        if category == "All Categories":
+            category = ""
+        
+        candidates = self._search_candidates(filter_text)
+        
+        self.keyword_list.setUpdatesEnabled(False)
+        try:
+            for i in range(self.keyword_list.count()):
+                item = self.keyword_list.item(i)
+                if candidates is not None and i not in candidates:
+                    item.setHidden(True)
+                    continue
+                item.setHidden(not self._matches(i, filter_text, category))
+        finally:
+            self.keyword_list.setUpdatesEnabled(True)
+    
+    def _search_candidates(self, filter_text):
+        """Return the indices of keywords that may contain the lowercase filter text.
+        
+        Returns None if the text is too short to use the 3-gram index, in which
+        case every keyword is a candidate.
+        """
+        if len(filter_text) < 3:
+            return None
+        candidates = None
+        for j in range(len(filter_text) - 2):
+            indices = self._trigram_index.get(filter_text[j:j + 3])
+            if not indices:
+                return set()
+            candidates = indices if candidates is None else candidates & indices
+        return candidates
+    
+    def _matches(self, index, filter_text, category):
+        """Check the keyword at index against a lowercase filter text and a category."""
+        if filter_text not in self._names_lower[index]:
+            return False
+        if category and self.keywords[index].get('category', '') != category:
+            return False
+        return True
     
     def filter_keywords(self):
+        """Filter keywords immediately, dropping any pending debounced search."""
+        self._filter_timer.stop()
+        self._do_filter()
+    
+    def _do_filter(self):
         """Filter keywords based on search text and category."""
         filter_text = self.search_box.text()
         category = self.category_combo.currentText()
@@ -194,47 +305,52 @@ class KeywordEditorPanel(QtGui.QWidget):
         self.description_label.setText(kw.get('description', 'No description available.'))
         
         # Clear previous parameter widgets
-        self.clear_parameter_widgets()
+        self._recycle_parameter_widgets()
         
         # Load and display parameters
         self.load_keyword_parameters(kw)
     
-    def clear_parameter_widgets(self):
-        """Remove all parameter widgets from the layout."""
-        for i in reversed(range(self.param_layout.count())):
-            item = self.param_layout.itemAt(i)
-            if item.widget():
-                item.widget().deleteLater()
-            elif item.layout():
-                # Handle nested layouts if any
-                for j in reversed(range(item.layout().count())):
-                    widget = item.layout().itemAt(j).widget()
-                    if widget:
-                        widget.deleteLater()
-                item.layout().deleteLater()
-        
-        # Clear the layout
-        while self.param_layout.rowCount() > 0:
-            self.param_layout.removeRow(0)
-        
-        self.keyword_widgets = []
+    def _recycle_parameter_widgets(self):
+        """Remove all parameter widgets from the layout and keep them for reuse."""
+        # take rows from the end so the layout does not shift the remaining rows
+        for row_index in reversed(range(self.param_layout.rowCount())):
+            row = self.param_layout.takeRow(row_index)
+            for layout_item in (row.labelItem, row.fieldItem):
+                if layout_item is None:
+                    continue
+                widget = layout_item.widget()
+                if widget is None:
+                    continue
+                widget.hide()
+                pool = self._widget_pool.get(type(widget))
+                if pool is not None:
+                    pool.append(widget)
+                else:
+                    widget.deleteLater()
+        
+        self._param_names = []
+        self._param_widgets = []
+        self._param_datas = []
+    
+    def _take_widget(self, widget_class):
+        """Return a pooled widget of the given class, or a new one if none is left."""
+        pool = self._widget_pool[widget_class]
+        if pool:
+            widget = pool.pop()
+            widget.show()
+            return widget
+        return widget_class()
     
     def get_keyword_config(self, keyword_name):
         """Get the configuration for a specific keyword from the syntax data."""
-        if not hasattr(self, 'syntax_data') or 'ls_dyna_syntax' not in self.syntax_data:
-            return None
-            
         # Try exact match first
-        for example_name, example_data in self.syntax_data['ls_dyna_syntax'].get('examples', {}).items():
-            if 'keyword' in example_data and example_data['keyword'] == keyword_name:
-                return example_data
+        example_data = self._kw_index.get(keyword_name)
+        if example_data is not None:
+            return example_data
         
         # Try partial match for base names (e.g., MAT_001)
         if '_' in keyword_name:
-            base_name = keyword_name.split('_')[0] + '_'
-            for example_name, example_data in self.syntax_data['ls_dyna_syntax'].get('examples', {}).items():
-                if 'keyword' in example_data and example_data['keyword'].startswith(base_name):
-                    return example_data
+            return self._prefix_index.get(keyword_name.split('_', 1)[0] + '_')
         
         return None
 
@@ -250,15 +366,11 @@ class KeywordEditorPanel(QtGui.QWidget):
                                    f"No configuration found for keyword: {keyword_name}")
             return
         
-        if syntax_config:
-            # Add parameters from the syntax configuration
-            if 'parameters' in syntax_config:
-                for param_name, param_data in syntax_config['parameters'].items():
-                    self.add_parameter_widget(param_name, param_data)
-        else:
-            # Fallback: Add a message if no configuration found
-            label = QtGui.QLabel("No configuration available for this keyword.")
-            self.param_layout.addRow(label)
+        # Add parameters from the syntax configuration
+        params = syntax_config.get('parameters')
+        if params:
+            for param_name, param_data in params.items():
+                self.add_parameter_widget(param_name, param_data)
     
     def add_parameter_widget(self, name, param_data):
         """Add a widget for a parameter."""
@@ -267,29 +379,35 @@ class KeywordEditorPanel(QtGui.QWidget):
         description = param_data.get('description', '')
         
         # Create label with description as tooltip
-        label = QtGui.QLabel(name)
-        if description:
-            label.setToolTip(description)
+        label = self._take_widget(QtGui.QLabel)
+        label.setText(name)
+        label.setToolTip(description)
         
         # Create appropriate input widget based on parameter type
         if param_type == 'boolean':
-            widget = QtGui.QCheckBox()
+            widget = self._take_widget(QtGui.QCheckBox)
             widget.setChecked(bool(default))
         elif 'options' in param_data:
             # Dropdown for options
-            widget = QtGui.QComboBox()
-            for option in param_data['options']:
-                widget.addItem(str(option), option)
+            widget = self._take_widget(QtGui.QComboBox)
+            widget.clear()
+            options = param_data['options']
+            option_strs = [str(option) for option in options]
+            for option_str, option in zip(option_strs, options):
+                widget.addItem(option_str, option)
             
             # Set default value if it exists in options
-            if default is not None and str(default) in [widget.itemText(i) for i in range(widget.count())]:
+            if default is not None and str(default) in option_strs:
                 widget.setCurrentText(str(default))
         else:
             # Default to line edit
-            widget = QtGui.QLineEdit(str(default) if default is not None else '')
+            widget = self._take_widget(QtGui.QLineEdit)
+            widget.setText(str(default) if default is not None else '')
         
         # Store widget reference
-        self.keyword_widgets.append((name, widget, param_data))
+        self._param_names.append(name)
+        self._param_widgets.append(widget)
+        self._param_datas.append(param_data)
         
         # Add to layout
         self.param_layout.addRow(label, widget)
@@ -301,10 +419,12 @@ class KeywordEditorPanel(QtGui.QWidget):
         
         # Collect parameter values
         params = {}
-        for name, widget, param_data in self.keyword_widgets:
-            if isinstance(widget, QtGui.QCheckBox):
+        for name, widget in zip(self._param_names, self._param_widgets):
+            # the widgets are created by add_parameter_widget, never subclassed
+            widget_class = widget.__class__
+            if widget_class is QtGui.QCheckBox:
                 params[name] = widget.isChecked()
-            elif isinstance(widget, QtGui.QComboBox):
+            elif widget_class is QtGui.QComboBox:
                 params[name] = widget.currentData()
             else:
                 params[name] = widget.text()
@@ -315,6 +435,13 @@ class KeywordEditorPanel(QtGui.QWidget):
         # Show success message
         QtGui.QMessageBox.information(self, "Success", f"Updated {self.current_keyword['name']} with new parameters.")
     
+    def showEvent(self, event):
+        """Load the keyword data the first time the panel is shown."""
+        if not self._keywords_loaded:
+            self._keywords_loaded = True
+            self.load_keywords()
+        super().showEvent(event)
+    
     def closeEvent(self, event):
         """Handle window close event."""
         # Add any cleanup code here if needed
@@ -6,12 +6,10 @@ Nodeset Extractor Task Panel
 Task panel for extracting nodesets from FEM constraints.
 """
 
-import FreeCAD as App
-import FreeCADGui as Gui
 from PySide import QtCore, QtGui, QtWidgets
 
-
-from femutils.nodeset_extractor import process_analysis
+# FreeCAD, FreeCADGui and the nodeset extractor are imported where they are
+# used, so importing this module does not load the FEM machinery
 
 
 class _TaskPanel:
@@ -41,8 +39,10 @@ class _TaskPanel:
         
     def extract_nodesets(self):
         """Extract nodesets from the active analysis"""
+        import FreeCAD as App
         try:
             import FemGui
+            from femutils.nodeset_extractor import process_analysis
             analysis = FemGui.getActiveAnalysis()
             if analysis:
                 result = process_analysis(analysis, create_text_object=True)
@@ -58,11 +58,13 @@ class _TaskPanel:
     
     def accept(self):
         """Called when the task panel is accepted"""
+        import FreeCADGui as Gui
         Gui.Control.closeDialog()
         return True
         
     def reject(self):
         """Called when the task panel is rejected"""
+        import FreeCADGui as Gui
         Gui.Control.closeDialog()
         return True
     
@@ -73,6 +75,7 @@ class _TaskPanel:
     def clicked(self, button):
         """Handle button clicks"""
         if button == QtGui.QDialogButtonBox.Close:
+            import FreeCADGui as Gui
             Gui.Control.closeDialog()
             return True
         return False
@@ -1,21 +1,276 @@
 import FreeCAD
-import FreeCADGui
+import functools
 import os
-import json
+import shlex
 import time
-import shutil
-import subprocess
+from collections import deque
+from pathlib import Path
+from types import MappingProxyType
+from PySide import QtCore
 from PySide import QtGui
 
+# Print the DEBUG messages and the full starter output, toggled from the task panel
+DEBUG = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/OpenRadioss").GetBool("Debug", False)
+
+
+@functools.lru_cache(maxsize=None)
+def _or_layout(install_dir):
+    """Return the executables and library directories of the OpenRadioss installation in install_dir"""
+    base = Path(install_dir) / 'OpenRadioss'
+    return MappingProxyType({
+        "STARTER": str(base / 'exec/starter_linux64_gf'),
+        "ENGINE": str(base / 'exec/engine_linux64_gf'),
+        "HM_READER_LIB": str(base / 'extlib/hm_reader/linux64'),
+        "H3D_LIB": str(base / 'extlib/h3d/lib/linux64'),
+        "RAD_CFG_PATH": str(base / 'hm_cfg_files'),
+    })
+
+
+def _starter_script(starter, quiet):
+    """Return the shell commands running the starter executable on fem_export.k
+
+    If quiet, the starter's stdout is discarded, its errors are still reported.
+    """
+    starter_command = f"{shlex.quote(starter)} -i fem_export.k"
+    if quiet:
+        # dropped by the kernel, never read through the pipe
+        starter_command += " >/dev/null"
+    return " && ".join((
+        'echo "Running starter..."',
+        starter_command,
+        'echo "Starter completed, looking for generated files:"',
+        "ls -la fem_export*.rad",
+    ))
+
+
+@functools.lru_cache(maxsize=None)
+def _solver_scripts(install_dir):
+    """Return the shell commands of the solver runs with the OpenRadioss installation in install_dir
+
+    STARTER runs the starter on fem_export.k, QUIET_STARTER too but discards its stdout,
+    ENGINE runs the engine on the first .rad file written by the starter
+    and SOLVER runs the starter and then the engine.
+    """
+    layout = _or_layout(install_dir)
+    starter = _starter_script(layout["STARTER"], quiet=False)
+    engine = " && ".join((
+        'echo "Running engine with first available .rad file..."',
+        # bash expands the glob in sorted order, the first match is the lowest numbered file
+        "ENGINE_INPUT=fem_export_0000.rad",
+        'for f in fem_export_*.rad; do [ -e "$f" ] && ENGINE_INPUT="$f"; break; done',
+        'echo "Using input file: $ENGINE_INPUT"',
+        f'{shlex.quote(layout["ENGINE"])} -i "$ENGINE_INPUT"',
+    ))
+    return MappingProxyType({
+        "STARTER": starter,
+        "QUIET_STARTER": _starter_script(layout["STARTER"], quiet=True),
+        "ENGINE": engine,
+        "SOLVER": f"{starter} && {engine}",
+    })
+
+
+def _solver_env_script(install_dir, omp_threads):
+    """Return the environment setup for running the solver scripts from a terminal with omp_threads threads"""
+    layout = _or_layout(install_dir)
+    return " && ".join((
+        f"export OPENRADIOSS_PATH={shlex.quote(install_dir)}",
+        f"export RAD_CFG_PATH={shlex.quote(layout['RAD_CFG_PATH'])}",
+        f"export RAD_H3D_PATH={shlex.quote(layout['H3D_LIB'])}",
+        f'export LD_LIBRARY_PATH={shlex.quote(layout["H3D_LIB"] + ":" + layout["HM_READER_LIB"])}":$LD_LIBRARY_PATH"',
+        f'export PATH={shlex.quote(layout["HM_READER_LIB"] + ":/opt/openmpi/bin")}":$PATH"',
+        f"export OMP_NUM_THREADS={omp_threads}",
+        'echo "Environment setup complete"',
+    ))
+
+
+def _manual_solver_command(install_dir, omp_threads, temp_work_dir, k_file_path):
+    """Return the terminal command running the solver on a copy of the K-file in temp_work_dir
+
+    omp_threads is the OMP_NUM_THREADS of the run, so that the command reproduces it.
+    """
+    temp_work_dir = shlex.quote(temp_work_dir)
+    return " && ".join((
+        f"mkdir -p {temp_work_dir}",
+        f"cp {shlex.quote(k_file_path)} {temp_work_dir}/",
+        f"cd {temp_work_dir}",
+        _solver_env_script(install_dir, omp_threads),
+        _solver_scripts(install_dir)["SOLVER"],
+    ))
+
+
+# K-file written when neither an analysis K-file nor the template is available,
+# formatted with the generation time
+_MINIMAL_K_TEMPLATE = (
+    b"* Test K-file generated by OpenRadioss solver\n"
+    b"$ Generated at: %s\n"
+    b"/RUN/OpenRadioss/test_case\n"
+)
+
+# K-file written when the template could not be copied, formatted with the generation time
+_FALLBACK_K_TEMPLATE = (
+    b"* Fallback K-file generated by OpenRadioss solver\n"
+    b"$ Generated at: %s\n"
+    b"$ Original template could not be copied properly\n"
+    b"*NODE\n"
+    b"       1       0.000000       0.000000       0.000000\n"
+    b"       2       1.000000       0.000000       0.000000\n"
+    b"       3       1.000000       1.000000       0.000000\n"
+    b"       4       0.000000       1.000000       0.000000\n"
+    b"*END\n"
+    b"*ELEMENT_SHELL\n"
+    b"       1       1       2       3       4       2\n"
+    b"*END\n"
+    b"*END\n"
+)
+
+
+def _write_minimal_k(path, template=_MINIMAL_K_TEMPLATE):
+    """Write a K-file from template, stamped with the current time, return whether it worked"""
+    try:
+        with open(path, 'wb') as f:
+            f.write(template % time.strftime("%Y-%m-%d %H:%M:%S").encode())
+    except OSError as e:
+        FreeCAD.Console.PrintError(f"Fallback creation failed: {e}\n")
+        return False
+    FreeCAD.Console.PrintMessage(f"Created fallback K-file at {path}\n")
+    return True
+
+
+def _starter_output_is_current(working_dir, k_file_path):
+    """Check if the starter's .rad files in working_dir are all newer than the K-file"""
+    k_mtime = os.stat(k_file_path).st_mtime
+    rad_mtimes = []
+    with os.scandir(working_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith('fem_export_') and entry.name.endswith('.rad'):
+                rad_mtimes.append(entry.stat().st_mtime)
+    return bool(rad_mtimes) and min(rad_mtimes) >= k_mtime
+
+
+def _working_dir_k_files(obj):
+    """Yield the paths of the K-files in the WorkingDir of obj, a solver or analysis-like object"""
+    working_dir = getattr(obj, 'WorkingDir', '')
+    if not working_dir or not os.path.isdir(working_dir):
+        return
+    with os.scandir(working_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.k') and entry.is_file():
+                yield entry.path
+
+
+def _solver_k_file(analysis):
+    """Return the first K-file in the WorkingDir of a solver of analysis, None if there is none
+
+    Analysis objects have no WorkingDir, their solvers write the K-file.
+    """
+    for obj in analysis.Group:
+        if obj.isDerivedFrom("Fem::FemSolverObjectPython"):
+            k_file = next(_working_dir_k_files(obj), None)
+            if k_file is not None:
+                return k_file
+    return None
+
+
+class _SolverRunner(QtCore.QRunnable, QtCore.QObject):
+    """Runs the OpenRadioss starter and engine outside the GUI thread"""
+
+    # return code and the last output lines of the run
+    finished = QtCore.Signal(int, str)
+
+    # number of output lines kept for the failure report
+    tail_lines = 200
+
+    def __init__(self, working_dir, env, scripts, run_starter=True, starter_output=True):
+        QtCore.QRunnable.__init__(self)
+        QtCore.QObject.__init__(self)
+        # the panel keeps the reference, Qt must not delete the Python object
+        self.setAutoDelete(False)
+        self.working_dir = working_dir
+        self.env = env
+        # shell commands of the installation, see _solver_scripts
+        self.scripts = scripts
+        self.run_starter = run_starter
+        self.starter_output = starter_output
+
+    def script(self):
+        """Return the shell commands of this run"""
+        if not self.run_starter:
+            return self.scripts["ENGINE"]
+        if self.starter_output:
+            return self.scripts["SOLVER"]
+        return f"{self.scripts['QUIET_STARTER']} && {self.scripts['ENGINE']}"
+
+    def run(self):
+        try:
+            self.finished.emit(*self.run_starter_and_engine())
+        except Exception as e:
+            self.finished.emit(-1, str(e))
+
+    def run_starter_and_engine(self):
+        import subprocess
+
+        # Starter, .rad file lookup and engine run as one shell pipeline,
+        # the same one the failure popup offers for manual execution
+        if DEBUG:
+            FreeCAD.Console.PrintMessage(f"DEBUG: Running starter and engine in {self.working_dir}\n")
+        process = subprocess.Popen(
+            ["/bin/bash", "-c", self.script()],
+            cwd=self.working_dir,
+            env=self.env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,  # keep the interleaving of both streams
+            text=True,
+            errors="replace",
+        )
+        # Forward the solver log as it is written, keep only its tail in memory
+        tail = deque(maxlen=self.tail_lines)
+        for line in process.stdout:
+            FreeCAD.Console.PrintMessage(line)
+            tail.append(line)
+        process.stdout.close()
+        returncode = process.wait()
+        return returncode, "".join(tail)
+
+
 class _TaskPanel(QtGui.QWidget):
     def __init__(self, obj):
         super().__init__()
         self.obj = obj
         self.form = self  # Important for FreeCAD to recognize the form
         self.k_file_updated = False  # Track if K-file was updated in this panel session
-
-        # Set the hardcode executable path
-        self.obj.Executable = '/home/nemo/Dokumente/Software/OpenRadioss_linux64/OpenRadioss/exec/engine_linux64_gf'
+        self._force_starter = False  # K-file rewritten, starter output is outdated
+        self._runner = None  # solver run in progress, if any
+        self._batch_runners = []  # runs of onSolveAll in progress
+        # popups, created on first use
+        self._running_dialog = None
+        self._failure_dialog = None
+        self._update_prompt = None
+        # document name -> name of the analysis object found in that document
+        self._analysis_cache = {}
+
+        # OpenRadioss installation and template K-file of the preferences, shared with FemToolsOR
+        from femtools.runORtools import _or_paths
+        or_paths = _or_paths()
+        self._install_dir = or_paths["BASE"]
+        self._template_k_file = or_paths["TEMPLATE"]
+        self._scripts = _solver_scripts(self._install_dir)
+        or_layout = _or_layout(self._install_dir)
+
+        # Set the executable path of the installation
+        self.obj.Executable = or_layout["ENGINE"]
+
+        # Set up environment for proper library loading, once per panel
+        env = os.environ.copy()
+        # Set LD_LIBRARY_PATH for shared libraries (from official docs)
+        env["LD_LIBRARY_PATH"] = f"{or_layout['H3D_LIB']}:{or_layout['HM_READER_LIB']}"
+        # Set PATH for executables
+        env["PATH"] = f"{or_layout['HM_READER_LIB']}:/opt/openmpi/bin:{env.get('PATH', '')}"
+        # Set other OpenRadioss environment variables (from official docs)
+        env["OPENRADIOSS_PATH"] = self._install_dir
+        env["RAD_CFG_PATH"] = or_layout["RAD_CFG_PATH"]
+        env["RAD_H3D_PATH"] = or_layout["H3D_LIB"]
+        env["OMP_NUM_THREADS"] = str(os.cpu_count() or 4)
+        self._solver_env = env
 
         layout = QtGui.QVBoxLayout()
         label = QtGui.QLabel("SolverOpenRadioss Task Panel")
@@ -26,8 +281,12 @@ class _TaskPanel(QtGui.QWidget):
         dir_label = QtGui.QLabel("Working Directory:")
         dir_layout.addWidget(dir_label)
 
+        # Start in the directory used last time
+        self._prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/OpenRadioss")
         self.working_dir_input = QtGui.QLineEdit()
-        self.working_dir_input.setText(os.path.expanduser("~"))
+        self.working_dir_input.setText(self._prefs.GetString("WorkingDir", os.path.expanduser("~")))
+        self._onWorkingDirChanged(self.working_dir_input.text())
+        self.working_dir_input.textChanged.connect(self._onWorkingDirChanged)
         dir_layout.addWidget(self.working_dir_input)
 
         browse_button = QtGui.QPushButton("Browse...")
@@ -38,13 +297,29 @@ class _TaskPanel(QtGui.QWidget):
 
         # Buttons
         self.solve_button = QtGui.QPushButton("Solve")
+        self.solve_all_button = QtGui.QPushButton("Solve All Analyses")
         self.update_kfile_button = QtGui.QPushButton("Update K File")
 
+        # Starter is skipped if its output is newer than the K-file, unless forced
+        self.force_rebuild_checkbox = QtGui.QCheckBox("Force rebuild (always run starter)")
+        layout.addWidget(self.force_rebuild_checkbox)
+
+        # Stored as the Debug parameter of Mod/Fem/OpenRadioss, off by default
+        self.debug_checkbox = QtGui.QCheckBox("Debug (show full starter output)")
+        self.debug_checkbox.setToolTip(
+            "If unchecked, the starter's log is discarded and only its errors are shown"
+        )
+        self.debug_checkbox.setChecked(DEBUG)
+        self.debug_checkbox.toggled.connect(self._setDebug)
+        layout.addWidget(self.debug_checkbox)
+
         layout.addWidget(self.solve_button)
+        layout.addWidget(self.solve_all_button)
         layout.addWidget(self.update_kfile_button)
 
         # Connect buttons to their methods
         self.solve_button.clicked.connect(self.onSolve)
+        self.solve_all_button.clicked.connect(self.onSolveAll)
         self.update_kfile_button.clicked.connect(self.onUpdateKFile)
 
         self.setLayout(layout)
@@ -57,53 +332,90 @@ class _TaskPanel(QtGui.QWidget):
 
         if directory:
             self.working_dir_input.setText(directory)
+            self._prefs.SetString("WorkingDir", directory)
+
+    def _setDebug(self, checked):
+        """Switch the debug output on or off, now and for later sessions"""
+        global DEBUG
+        DEBUG = checked
+        self._prefs.SetBool("Debug", checked)
+
+    def _onWorkingDirChanged(self, text):
+        """Keep the cached working directory in sync with the input field"""
+        self._cached_working_dir = text.strip() or os.path.expanduser("~")
 
     def get_working_directory_safe(self):
-        """Safely get the working directory, with fallback to home directory if UI not available"""
-        try:
-            if hasattr(self, 'working_dir_input') and self.working_dir_input:
-                working_dir = self.working_dir_input.text().strip()
-                if working_dir:
-                    return working_dir
-        except:
-            pass
-        # Fallback to home directory if UI not available or empty
-        return os.path.expanduser("~")
+        """Get the working directory, with fallback to home directory if the input is empty"""
+        return self._cached_working_dir
+
+    def _find_analysis(self):
+        """Return the selected analysis or the first analysis-like object of the active document"""
+        import FreeCADGui
+
+        # First try to get analysis from selection
+        selection = FreeCADGui.Selection.getSelection()
+        if selection:
+            # Check if selected object is an analysis
+            for obj in selection:
+                if hasattr(obj, 'WorkingDir') or 'Analysis' in obj.Name:
+                    return obj
+
+        # If no analysis in selection, find the active analysis
+        doc = FreeCAD.ActiveDocument
+        if doc is None:
+            return None
+
+        # Reuse the object found by an earlier scan as long as it is still in the document
+        cached_name = self._analysis_cache.get(doc.Name)
+        if cached_name is not None:
+            analysis = doc.getObject(cached_name)
+            if analysis is not None:
+                return analysis
+            del self._analysis_cache[doc.Name]
+
+        for obj in doc.Objects:
+            # Look for analysis objects or objects with solver settings,
+            # cheapest checks first: the name is a plain string
+            if 'Analysis' in obj.Name:
+                break
+            proxy_type = getattr(getattr(obj, 'Proxy', None), 'Type', '')
+            if 'Analysis' in proxy_type or 'Fem' in proxy_type:
+                break
+            # probe the property slots last
+            if hasattr(obj, 'WorkingDir') or hasattr(obj, 'FemMesh') or hasattr(obj, 'Mesh'):
+                break
+        else:
+            return None
+        self._analysis_cache[doc.Name] = obj.Name
+        return obj
 
     def onSolve(self):
         # Implement solve
-        if not self.k_file_updated:
-            reply = QtGui.QMessageBox.question(self, 'Update K File',
+        if self.k_file_updated:
+            self._continue_solve(False)
+            return
+        # Ask without blocking the event loop, the answer continues in _onUpdatePromptFinished
+        if self._update_prompt is None:
+            self._update_prompt = QtGui.QMessageBox(
+                QtGui.QMessageBox.Question, 'Update K File',
                 "The K-file was not updated in this panel session. Do you want to update it before solving?",
-                QtGui.QMessageBox.Yes | QtGui.QMessageBox.No, QtGui.QMessageBox.Yes)
-            if reply == QtGui.QMessageBox.Yes:
-                self.onUpdateKFile()
+                QtGui.QMessageBox.Yes | QtGui.QMessageBox.No, self)
+            self._update_prompt.setDefaultButton(QtGui.QMessageBox.Yes)
+            self._update_prompt.finished.connect(self._onUpdatePromptFinished)
+        self._update_prompt.open()
+
+    def _onUpdatePromptFinished(self, _result):
+        """Continue onSolve with the answer to the Update K File question"""
+        prompt = self._update_prompt
+        self._continue_solve(prompt.clickedButton() == prompt.button(QtGui.QMessageBox.Yes))
+
+    def _continue_solve(self, update_k_file):
+        """Start the solver, after updating the K-file if update_k_file"""
+        if update_k_file:
+            self.onUpdateKFile()
         try:
             # Get the active analysis object
-            analysis = None
-
-            # First try to get analysis from selection
-            selection = FreeCADGui.Selection.getSelection()
-            if selection:
-                # Check if selected object is an analysis
-                for obj in selection:
-                    if hasattr(obj, 'WorkingDir') or 'Analysis' in obj.Name:
-                        analysis = obj
-                        break
-
-            # If no analysis in selection, find the active analysis
-            if not analysis:
-                doc = FreeCAD.ActiveDocument
-                for obj in doc.Objects:
-                    # Look for analysis objects or objects with solver settings
-                    if ('Analysis' in obj.Name or
-                        hasattr(obj, 'WorkingDir') or
-                        hasattr(obj, 'FemMesh') or
-                        hasattr(obj, 'Mesh') or
-                        (hasattr(obj, 'Proxy') and hasattr(obj.Proxy, 'Type') and
-                         ('Analysis' in obj.Proxy.Type or 'Fem' in obj.Proxy.Type))):
-                        analysis = obj
-                        break
+            analysis = self._find_analysis()
 
             if not analysis:
                 QtGui.QMessageBox.warning(self, "Error", "No analysis object found in document. Please create or select an analysis first.")
@@ -111,6 +423,7 @@ class _TaskPanel(QtGui.QWidget):
 
             # Get working directory from user selection
             working_dir = self.get_working_directory_safe()
+            self._prefs.SetString("WorkingDir", working_dir)
             k_file_path = os.path.join(working_dir, 'fem_export.k')
 
             # Check if K-file exists
@@ -122,77 +435,30 @@ class _TaskPanel(QtGui.QWidget):
             self.showRunningPopup()
 
             try:
-                # Set up OpenRadioss environment variables
-                openradioss_path = '/home/nemo/Dokumente/Software/OpenRadioss_linux64'
-
-                # Set up environment for proper library loading
-                custom_env = os.environ.copy()
-
-                # Set hardcoded paths for consistency with bash script
-                openradioss_path = '/home/nemo/Dokumente/Software/OpenRadioss_linux64'
-
-                # Set LD_LIBRARY_PATH for shared libraries (from official docs)
-                hm_reader_lib = "/home/nemo/Dokumente/Software/OpenRadioss_linux64/OpenRadioss/extlib/hm_reader/linux64"
-                h3d_lib = "/home/nemo/Dokumente/Software/OpenRadioss_linux64/OpenRadioss/extlib/h3d/lib/linux64"
-
-                custom_env["LD_LIBRARY_PATH"] = f"{h3d_lib}:{hm_reader_lib}"
-
-                # Set PATH for executables
-                custom_env["PATH"] = f"{hm_reader_lib}:/opt/openmpi/bin:" + custom_env["PATH"]
-
-                # Set other OpenRadioss environment variables (from official docs)
-                custom_env["OPENRADIOSS_PATH"] = openradioss_path
-                custom_env["RAD_CFG_PATH"] = "/home/nemo/Dokumente/Software/OpenRadioss_linux64/OpenRadioss/hm_cfg_files"
-                custom_env["RAD_H3D_PATH"] = h3d_lib
-                custom_env["OMP_NUM_THREADS"] = "4"
-
-                FreeCAD.Console.PrintMessage(f"DEBUG: Environment setup complete\n")
-                FreeCAD.Console.PrintMessage(f"DEBUG: LD_LIBRARY_PATH = {custom_env.get('LD_LIBRARY_PATH', 'Not set')}\n")
-
-                # Run OpenRadioss solver using proper starter + engine workflow
-                # First run the starter to generate the key file
-                starter_executable = '/home/nemo/Dokumente/Software/OpenRadioss_linux64/OpenRadioss/exec/starter_linux64_gf'
-
-                FreeCAD.Console.PrintMessage(f"DEBUG: Running starter: {starter_executable}\n")
-                starter_cmd = [starter_executable, "-i", "fem_export.k"]
-                starter_result = subprocess.run(starter_cmd, cwd=working_dir, env=custom_env, capture_output=True, text=True)
-
-                if starter_result.returncode == 0:
-                    FreeCAD.Console.PrintMessage("Starter completed successfully\n")
-
-                    # Check what files were generated by the starter
-                    import glob
-                    rad_files = glob.glob(os.path.join(working_dir, "fem_export_*.rad"))
-                    if rad_files:
-                        # Sort files to get the lowest numbered one first
-                        rad_files.sort()
-                        engine_input = os.path.basename(rad_files[0])
-                        FreeCAD.Console.PrintMessage(f"Found engine input files: {[os.path.basename(f) for f in rad_files]}\n")
-                        FreeCAD.Console.PrintMessage(f"Using engine input file: {engine_input}\n")
-                    else:
-                        # Fallback to default naming
-                        engine_input = "fem_export_0000.rad"
-                        FreeCAD.Console.PrintMessage(f"Using default engine input: {engine_input}\n")
-
-                    # Now run the engine
-                    engine_executable = '/home/nemo/Dokumente/Software/OpenRadioss_linux64/OpenRadioss/exec/engine_linux64_gf'
-
-                    FreeCAD.Console.PrintMessage(f"DEBUG: Running engine: {engine_executable}\n")
-                    engine_cmd = [engine_executable, "-i", engine_input]
-                    engine_result = subprocess.run(engine_cmd, cwd=working_dir, env=custom_env, capture_output=True, text=True)
-
-                    if engine_result.returncode == 0:
-                        QtGui.QMessageBox.information(self, "Success", "OpenRadioss solver completed successfully!")
-                    else:
-                        FreeCAD.Console.PrintError(f"Engine failed with return code {engine_result.returncode}\n")
-                        FreeCAD.Console.PrintError(f"STDOUT: {engine_result.stdout}\n")
-                        FreeCAD.Console.PrintError(f"STDERR: {engine_result.stderr}\n")
-                        self.showFailurePopup()
-                else:
-                    FreeCAD.Console.PrintError(f"Starter failed with return code {starter_result.returncode}\n")
-                    FreeCAD.Console.PrintError(f"STDOUT: {starter_result.stdout}\n")
-                    FreeCAD.Console.PrintError(f"STDERR: {starter_result.stderr}\n")
-                    self.showFailurePopup()
+                if DEBUG:
+                    FreeCAD.Console.PrintMessage(
+                        "DEBUG: Environment setup complete\n"
+                        f"DEBUG: LD_LIBRARY_PATH = {self._solver_env['LD_LIBRARY_PATH']}\n"
+                    )
+
+                # Rerun the starter only if the K-file changed since its last run
+                run_starter = (
+                    self._force_starter
+                    or self.force_rebuild_checkbox.isChecked()
+                    or not _starter_output_is_current(working_dir, k_file_path)
+                )
+                if not run_starter:
+                    FreeCAD.Console.PrintMessage("Starter output is up to date, running engine only\n")
+                self._force_starter = False
+
+                # Run starter and engine in the thread pool so the GUI stays responsive
+                self._runner = _SolverRunner(
+                    working_dir, self._solver_env, self._scripts, run_starter, starter_output=DEBUG
+                )
+                self._runner.finished.connect(self.onSolverFinished)
+                QtCore.QThreadPool.globalInstance().start(self._runner)
+                self.solve_button.setEnabled(False)
+                self.solve_all_button.setEnabled(False)
 
             except Exception as e:
                 FreeCAD.Console.PrintError(f"Error running OpenRadioss solver: {e}\n")
@@ -203,30 +469,95 @@ class _TaskPanel(QtGui.QWidget):
             FreeCAD.Console.PrintError(f"Error in onSolve: {e}\n")
             self.showFailurePopup()
 
+    def onSolverFinished(self, returncode, output_tail):
+        """Report the result of a solver run started by onSolve"""
+        self._runner = None
+        self.solve_button.setEnabled(True)
+        self.solve_all_button.setEnabled(True)
+        if self._running_dialog is not None:
+            self._running_dialog.hide()
+        if returncode == 0:
+            QtGui.QMessageBox.information(self, "Success", "OpenRadioss solver completed successfully!")
+        else:
+            FreeCAD.Console.PrintError(f"Solver failed with return code {returncode}\n")
+            self.showFailurePopup(output_tail)
+
+    def onSolveAll(self):
+        """Solve every analysis of the active document in parallel, each in its own run directory"""
+        from femtools.femutils import copy_file
+
+        doc = FreeCAD.ActiveDocument
+        analyses = [obj for obj in doc.Objects if obj.isDerivedFrom("Fem::FemAnalysis")] if doc else []
+        if not analyses:
+            QtGui.QMessageBox.warning(self, "Error", "No analysis object found in document.")
+            return
+
+        working_dir = self.get_working_directory_safe()
+
+        # Split the cores between the runs: workers x OMP_NUM_THREADS <= cpu count
+        cpu_count = os.cpu_count() or 4
+        workers = max(1, min(len(analyses), cpu_count // 4))
+        env = dict(self._solver_env)
+        env["OMP_NUM_THREADS"] = str(max(1, cpu_count // workers))
+        pool = QtCore.QThreadPool(self)
+        pool.setMaxThreadCount(workers)
+
+        skipped = []
+        for i, analysis in enumerate(analyses):
+            # Each analysis runs a copy of the K-file written by its solver
+            k_file = _solver_k_file(analysis)
+            if k_file is None:
+                FreeCAD.Console.PrintError(
+                    f"{analysis.Label}: no K-file in the working directory of its solver, skipped\n"
+                )
+                skipped.append(analysis.Label)
+                continue
+            run_dir = os.path.join(working_dir, f"run_{i}_{analysis.Name}")
+            try:
+                os.makedirs(run_dir, exist_ok=True)
+                copy_file(k_file, os.path.join(run_dir, 'fem_export.k'))
+            except OSError as e:
+                FreeCAD.Console.PrintError(f"{analysis.Label}: could not prepare {run_dir}: {e}\n")
+                skipped.append(analysis.Label)
+                continue
+
+            runner = _SolverRunner(run_dir, env, self._scripts, starter_output=DEBUG)
+            runner.finished.connect(self.onBatchSolverFinished)
+            self._batch_runners.append(runner)
+            pool.start(runner)
+
+        if self._batch_runners:
+            FreeCAD.Console.PrintMessage(
+                f"Solving {len(self._batch_runners)} analyses with {workers} parallel runs\n"
+            )
+            self.solve_button.setEnabled(False)
+            self.solve_all_button.setEnabled(False)
+        if skipped:
+            QtGui.QMessageBox.warning(
+                self, "Analyses skipped",
+                "These analyses were not solved, see the report view:\n" + "\n".join(skipped),
+            )
+
+    def onBatchSolverFinished(self, returncode, output_tail):
+        """Report one finished run of onSolveAll"""
+        runner = self.sender()
+        if runner in self._batch_runners:
+            self._batch_runners.remove(runner)
+        if returncode == 0:
+            FreeCAD.Console.PrintMessage(f"Solver run in {runner.working_dir} completed successfully\n")
+        else:
+            FreeCAD.Console.PrintError(
+                f"Solver run in {runner.working_dir} failed with return code {returncode}\n"
+            )
+        if not self._batch_runners:
+            self.solve_button.setEnabled(True)
+            self.solve_all_button.setEnabled(True)
+            QtGui.QMessageBox.information(self, "Finished", "All OpenRadioss solver runs have finished.")
+
     def onUpdateKFile(self):
         try:
             # Get the active analysis object
-            analysis = None
-
-            # First try to get analysis from selection
-            selection = FreeCADGui.Selection.getSelection()
-            if selection:
-                # Check if selected object is an analysis
-                for obj in selection:
-                    if hasattr(obj, 'WorkingDir') or 'Analysis' in obj.Name:
-                        analysis = obj
-                        break
-
-            # If no analysis in selection, find the active analysis
-            if not analysis:
-                doc = FreeCAD.ActiveDocument
-                for obj in doc.Objects:
-                    # Look for analysis objects or objects with solver settings
-                    if ('Analysis' in obj.Name or
-                        hasattr(obj, 'WorkingDir') or
-                        (hasattr(obj, 'Proxy') and hasattr(obj.Proxy, 'Type') and 'Analysis' in obj.Proxy.Type)):
-                        analysis = obj
-                        break
+            analysis = self._find_analysis()
 
             if not analysis:
                 QtGui.QMessageBox.warning(self, "Error", "No analysis object found in document. Please create or select an analysis first.")
@@ -236,9 +567,13 @@ class _TaskPanel(QtGui.QWidget):
             working_dir = self.get_working_directory_safe()
             k_file_path = os.path.join(working_dir, 'fem_export.k')
 
-            FreeCAD.Console.PrintMessage(f"DEBUG: Working directory = {working_dir}\n")
-            FreeCAD.Console.PrintMessage(f"DEBUG: K-file path = {k_file_path}\n")
-            FreeCAD.Console.PrintMessage(f"DEBUG: Template file exists = {os.path.exists('/home/nemo/Dokumente/Sandbox/Fem_upgraded/zug_test3_RS.k')}\n")
+            if DEBUG:
+                FreeCAD.Console.PrintMessage(
+                    f"DEBUG: Working directory = {working_dir}\n"
+                    f"DEBUG: K-file path = {k_file_path}\n"
+                    f"DEBUG: Template file exists = {os.path.exists(self._template_k_file)}\n"
+                    f"DEBUG: Analysis working directory = {getattr(analysis, 'WorkingDir', None)}\n"
+                )
 
             # Create a K-file from analysis data
             try:
@@ -247,47 +582,32 @@ class _TaskPanel(QtGui.QWidget):
 
                 # Look for existing input files in the analysis
                 if hasattr(analysis, 'WorkingDir'):
-                    analysis_working_dir = analysis.WorkingDir
-                    FreeCAD.Console.PrintMessage(f"DEBUG: Analysis working directory = {analysis_working_dir}\n")
-
                     # Look for existing K-files in analysis working directory
-                    if os.path.exists(analysis_working_dir):
-                        for filename in os.listdir(analysis_working_dir):
-                            if filename.endswith(('.k')):
-                                source_file = os.path.join(analysis_working_dir, filename)
-                                success = self.export_template_file(source_file, k_file_path)
-                                if success:
-                                    FreeCAD.Console.PrintMessage(f"Copied existing analysis file: {filename}\n")
-                                    k_file_found = True
-                                    break
+                    for source_file in _working_dir_k_files(analysis):
+                        success = self.export_template_file(source_file, k_file_path)
+                        if success:
+                            FreeCAD.Console.PrintMessage(f"Copied existing analysis file: {os.path.basename(source_file)}\n")
+                            k_file_found = True
+                            break
 
                 if not k_file_found:
                     # Fallback to template if no analysis file found
-                    template_file = "/home/nemo/Dokumente/Sandbox/Fem_upgraded/zug_test3_RS.k"
-                    if os.path.exists(template_file):
-                        FreeCAD.Console.PrintMessage(f"DEBUG: About to export template to {k_file_path}\n")
-                        self.export_template_file(template_file, k_file_path)
-                        FreeCAD.Console.PrintMessage(f"DEBUG: Template export completed\n")
-                    else:
-                        # Create minimal K-file as last resort
-                        try:
-                            with open(k_file_path, 'w') as f:
-                                f.write("* Test K-file generated by OpenRadioss solver\n")
-                                f.write("$ Generated at: " + time.strftime("%Y-%m-%d %H:%M:%S") + "\n")
-                                f.write("/RUN/OpenRadioss/test_case\n")
-                            FreeCAD.Console.PrintMessage(f"Created minimal K-file at {k_file_path}\n")
-                        except Exception as fallback_error:
-                            FreeCAD.Console.PrintError(f"Fallback creation failed: {fallback_error}\n")
-                            return False
+                    if os.path.exists(self._template_k_file):
+                        self.export_template_file(self._template_k_file, k_file_path)
+                    # Create minimal K-file as last resort
+                    elif not _write_minimal_k(k_file_path):
+                        return False
 
                 # Verify the file was actually created
-                if os.path.exists(k_file_path):
-                    file_size = os.path.getsize(k_file_path)
-                    FreeCAD.Console.PrintMessage(f"DEBUG: File successfully created, size = {file_size} bytes\n")
-                else:
-                    FreeCAD.Console.PrintError(f"DEBUG: File was NOT created at {k_file_path}\n")
+                if not os.path.exists(k_file_path):
+                    FreeCAD.Console.PrintError(f"File was NOT created at {k_file_path}\n")
+                elif DEBUG:
+                    FreeCAD.Console.PrintMessage(
+                        f"DEBUG: File successfully created, size = {os.path.getsize(k_file_path)} bytes\n"
+                    )
 
                 self.k_file_updated = True
+                self._force_starter = True
                 FreeCAD.Console.PrintMessage(f"K-file updated successfully at {k_file_path}\n")
                 QtGui.QMessageBox.information(self, "Success", f"K-file updated successfully\nLocation: {k_file_path}")
 
@@ -300,119 +620,145 @@ class _TaskPanel(QtGui.QWidget):
             QtGui.QMessageBox.warning(self, "Error", f"Failed to update K-file: {str(e)}")
 
     def export_template_file(self, source_file, target_file):
-        """Export template file by reading and writing content (works in sandbox)"""
+        """Export template file by copying its content in the kernel, a copy onto itself succeeds"""
         try:
             source_size = os.path.getsize(source_file)
-            FreeCAD.Console.PrintMessage(f"DEBUG: Exporting {source_file} ({source_size} bytes) to {target_file}\n")
-
-            # Use binary mode to handle any file type properly
-            with open(source_file, 'rb') as src:
-                content = src.read()
-
-            FreeCAD.Console.PrintMessage(f"DEBUG: Read {len(content)} bytes from source\n")
-
-            # Write in binary mode to preserve all data
-            with open(target_file, 'wb') as dst:
-                dst.write(content)
-
-            # Verify the file was created and has correct content
-            if os.path.exists(target_file):
-                target_size = os.path.getsize(target_file)
-                FreeCAD.Console.PrintMessage(f"DEBUG: Written {target_size} bytes to target\n")
-
-                if target_size == source_size:
-                    FreeCAD.Console.PrintMessage(f"Successfully exported template: {source_size} bytes\n")
-                    return True
-                else:
-                    FreeCAD.Console.PrintError(f"Size mismatch: source={source_size}, target={target_size}\n")
-                    # Try alternative method with shutil.copy2
-                    try:
-                        FreeCAD.Console.PrintMessage(f"DEBUG: Trying shutil.copy2 as fallback\n")
-                        shutil.copy2(source_file, target_file)
-                        fallback_size = os.path.getsize(target_file)
-                        if fallback_size == source_size:
-                            FreeCAD.Console.PrintMessage(f"Successfully copied with shutil.copy2: {source_size} bytes\n")
-                            return True
-                        else:
-                            FreeCAD.Console.PrintError(f"Shutil copy also failed: {fallback_size} bytes\n")
-                            # Create a simple fallback K-file as last resort
-                            try:
-                                with open(target_file, 'w') as f:
-                                    f.write("* Fallback K-file generated by OpenRadioss solver\n")
-                                    f.write("$ Generated at: " + time.strftime("%Y-%m-%d %H:%M:%S") + "\n")
-                                    f.write("$ Original template could not be copied properly\n")
-                                    f.write("*NODE\n")
-                                    f.write("       1       0.000000       0.000000       0.000000\n")
-                                    f.write("       2       1.000000       0.000000       0.000000\n")
-                                    f.write("       3       1.000000       1.000000       0.000000\n")
-                                    f.write("       4       0.000000       1.000000       0.000000\n")
-                                    f.write("*END\n")
-                                    f.write("*ELEMENT_SHELL\n")
-                                    f.write("       1       1       2       3       4       2\n")
-                                    f.write("*END\n")
-                                    f.write("*END\n")
-                                FreeCAD.Console.PrintMessage(f"Created simple fallback K-file\n")
-                                return True
-                            except Exception as fallback_error:
-                                FreeCAD.Console.PrintError(f"Fallback creation failed: {fallback_error}\n")
-                                return False
-                    except Exception as copy_error:
-                        FreeCAD.Console.PrintError(f"Shutil copy failed: {copy_error}\n")
-                        return False
-            else:
-                FreeCAD.Console.PrintError(f"Target file was not created: {target_file}\n")
-                return False
+            from femtools.femutils import copy_file
 
-        except Exception as e:
+            # Copy in the kernel, the content never passes through Python
+            copy_file(source_file, target_file)
+            target_size = os.path.getsize(target_file)
+        except OSError as e:
             FreeCAD.Console.PrintError(f"Error exporting template file: {e}\n")
             return False
 
+        if DEBUG:
+            FreeCAD.Console.PrintMessage(
+                f"DEBUG: Exported {source_file} ({source_size} bytes) to {target_file}\n"
+                f"DEBUG: Written {target_size} bytes to target\n"
+            )
+        if target_size != source_size:
+            FreeCAD.Console.PrintError(f"Size mismatch: source={source_size}, target={target_size}\n")
+            return _write_minimal_k(target_file, _FALLBACK_K_TEMPLATE)
+        FreeCAD.Console.PrintMessage(f"Successfully exported template: {source_size} bytes\n")
+        return True
+
     def showRunningPopup(self):
         """Show a simple popup indicating the solver is running"""
-        # Create a simple dialog
+        if self._running_dialog is None:
+            # Create a simple dialog, once per panel
+            dialog = QtGui.QDialog(self)
+            dialog.setWindowTitle("OpenRadioss Solver Running")
+            dialog.resize(400, 200)
+
+            layout = QtGui.QVBoxLayout()
+
+            # Simple message
+            self._running_message_label = QtGui.QLabel()
+            self._running_message_label.setWordWrap(True)
+            layout.addWidget(self._running_message_label)
+
+            # Simple instructions
+            info_label = QtGui.QLabel("If the solver fails in FreeCAD, you can run it externally in your terminal.")
+            info_label.setWordWrap(True)
+            info_label.setStyleSheet("color: #666; font-size: 10px;")
+            layout.addWidget(info_label)
+
+            # Close button
+            close_button = QtGui.QPushButton("Close")
+            close_button.clicked.connect(dialog.accept)
+            layout.addWidget(close_button)
+
+            dialog.setLayout(layout)
+            self._running_dialog = dialog
+
+        working_dir = self.get_working_directory_safe()
+        self._running_message_label.setText("OpenRadioss solver is running...\n\nWorking directory: " + working_dir)
+        self._running_dialog.show()
+
+    def _createFailureDialog(self):
+        """Create the failure popup, its per-run contents are set in showFailurePopup"""
+        # Create a dialog for failure information
         dialog = QtGui.QDialog(self)
-        dialog.setWindowTitle("OpenRadioss Solver Running")
-        dialog.resize(400, 200)
+        dialog.setWindowTitle("OpenRadioss Solver Execution Failed")
+        dialog.resize(600, 400)
 
         layout = QtGui.QVBoxLayout()
 
-        # Simple message
-        working_dir = self.get_working_directory_safe()
+        # Title
+        title_label = QtGui.QLabel("OpenRadioss Solver Failed")
+        title_label.setStyleSheet("font-weight: bold; font-size: 14px; color: red;")
+        layout.addWidget(title_label)
+
+        # Error message
+        error_label = QtGui.QLabel("The automatic solver execution failed. You can run OpenRadioss manually using the command below:")
+        error_label.setWordWrap(True)
+        layout.addWidget(error_label)
+
+        # Last solver output
+        self._failure_output_text = QtGui.QTextEdit()
+        self._failure_output_text.setReadOnly(True)
+        layout.addWidget(self._failure_output_text)
+
+        self._failure_working_dir_label = QtGui.QLabel()
+        self._failure_working_dir_label.setStyleSheet("font-weight: bold; background-color: #f0f0f0; padding: 5px;")
+        layout.addWidget(self._failure_working_dir_label)
+
+        # Command instructions
+        command_label = QtGui.QLabel("Run this command in your terminal:")
+        command_label.setStyleSheet("font-weight: bold;")
+        layout.addWidget(command_label)
+
+        # Command text area
+        self._failure_command_text = QtGui.QTextEdit()
+        self._failure_command_text.setReadOnly(True)
+        self._failure_command_text.setMaximumHeight(100)
+        layout.addWidget(self._failure_command_text)
+
+        # Additional instructions
+        instructions_label = QtGui.QLabel("Instructions:\n"
+                                       "1. Copy the command above\n"
+                                       "2. Open a terminal and run the command\n"
+                                       "3. The command sets up proper environment variables\n"
+                                       "4. Creates a temp directory in /tmp\n"
+                                       "5. Files are copied from home directory to /tmp\n"
+                                       "6. Starter processes the K-file and generates .rad files\n"
+                                       "7. Engine automatically detects and uses the correct .rad file\n"
+                                       "8. Check the output files (.out, .msg, .sta) in /tmp")
+        instructions_label.setWordWrap(True)
+        layout.addWidget(instructions_label)
 
-        message_label = QtGui.QLabel("OpenRadioss solver is running...\n\nWorking directory: " + working_dir)
-        message_label.setWordWrap(True)
-        layout.addWidget(message_label)
+        # Buttons
+        button_layout = QtGui.QHBoxLayout()
 
-        # Simple instructions
-        info_label = QtGui.QLabel("If the solver fails in FreeCAD, you can run it externally in your terminal.")
-        info_label.setWordWrap(True)
-        info_label.setStyleSheet("color: #666; font-size: 10px;")
-        layout.addWidget(info_label)
+        copy_button = QtGui.QPushButton("Copy Command")
+        copy_button.clicked.connect(
+            lambda: QtGui.QApplication.clipboard().setText(self._failure_command_text.toPlainText())
+        )
+        button_layout.addWidget(copy_button)
 
-        # Close button
         close_button = QtGui.QPushButton("Close")
         close_button.clicked.connect(dialog.accept)
-        layout.addWidget(close_button)
+        button_layout.addWidget(close_button)
 
-    def showFailurePopup(self):
-        """Show a popup with instructions for manual solver execution when automatic execution fails"""
-        try:
-            # Create a dialog for failure information
-            dialog = QtGui.QDialog(self)
-            dialog.setWindowTitle("OpenRadioss Solver Execution Failed")
-            dialog.resize(600, 400)
+        layout.addLayout(button_layout)
+        dialog.setLayout(layout)
+        return dialog
 
-            layout = QtGui.QVBoxLayout()
+    def showFailurePopup(self, output_tail=""):
+        """Show a popup with instructions for manual solver execution when automatic execution fails
 
-            # Title
-            title_label = QtGui.QLabel("OpenRadioss Solver Failed")
-            title_label.setStyleSheet("font-weight: bold; font-size: 14px; color: red;")
-            layout.addWidget(title_label)
+        output_tail are the last output lines of the failed run, shown if given.
+        """
+        if self._running_dialog is not None:
+            self._running_dialog.hide()
+        try:
+            if self._failure_dialog is None:
+                self._failure_dialog = self._createFailureDialog()
 
-            # Error message
-            error_label = QtGui.QLabel("The automatic solver execution failed. You can run OpenRadioss manually using the command below:")
-            error_label.setWordWrap(True)
-            layout.addWidget(error_label)
+            # Last solver output
+            self._failure_output_text.setPlainText(output_tail)
+            self._failure_output_text.setVisible(bool(output_tail))
 
             # Get working directory
             working_dir = self.get_working_directory_safe()
@@ -424,77 +770,17 @@ class _TaskPanel(QtGui.QWidget):
             # Create temp working directory for bash script
             temp_work_dir = f"/tmp/openradioss_work_{int(time.time())}"
 
-            working_dir_label = QtGui.QLabel(f"Working Directory: {working_dir}\nTemp Directory: {temp_work_dir}")
-            working_dir_label.setStyleSheet("font-weight: bold; background-color: #f0f0f0; padding: 5px;")
-            layout.addWidget(working_dir_label)
-
-            # Command instructions
-            command_label = QtGui.QLabel("Run this command in your terminal:")
-            command_label.setStyleSheet("font-weight: bold;")
-            layout.addWidget(command_label)
-
-            # Command text area
-            command_text = QtGui.QTextEdit()
-            command_text.setReadOnly(True)
-            command_text.setMaximumHeight(100)
-
-            # Get executable path
-            executable = getattr(self.obj, 'Executable', '/home/nemo/Dokumente/Software/OpenRadioss_linux64/OpenRadioss/exec/engine_linux64_gf')
-            starter_executable = getattr(self.obj, 'Starter', '/home/nemo/Dokumente/Software/OpenRadioss_linux64/OpenRadioss/exec/starter_linux64_gf')
+            self._failure_working_dir_label.setText(f"Working Directory: {working_dir}\nTemp Directory: {temp_work_dir}")
 
             # Create temp working directory and copy files with environment setup
-            command = (f"mkdir -p '{temp_work_dir}' && "
-                      f"cp '{k_file_path}' '{temp_work_dir}/' && "
-                      f"cd '{temp_work_dir}' && "
-                      f"export OPENRADIOSS_PATH='/home/nemo/Dokumente/Software/OpenRadioss_linux64' && "
-                      f"export RAD_CFG_PATH=\"/home/nemo/Dokumente/Software/OpenRadioss_linux64/OpenRadioss/hm_cfg_files\" && "
-                      f"export RAD_H3D_PATH=\"/home/nemo/Dokumente/Software/OpenRadioss_linux64/OpenRadioss/extlib/h3d/lib/linux64\" && "
-                      f"export LD_LIBRARY_PATH=\"/home/nemo/Dokumente/Software/OpenRadioss_linux64/OpenRadioss/extlib/h3d/lib/linux64:/home/nemo/Dokumente/Software/OpenRadioss_linux64/OpenRadioss/extlib/hm_reader/linux64:$LD_LIBRARY_PATH\" && "
-                      f"export PATH=\"/home/nemo/Dokumente/Software/OpenRadioss_linux64/OpenRadioss/extlib/hm_reader/linux64:/opt/openmpi/bin:$PATH\" && "
-                      f"export OMP_NUM_THREADS=4 && "
-                      f"echo \"Environment setup complete\" && "
-                      f"echo \"Running starter...\" && "
-                      f"'/home/nemo/Dokumente/Software/OpenRadioss_linux64/OpenRadioss/exec/starter_linux64_gf' -i fem_export.k && "
-                      f"echo \"Starter completed, looking for generated files:\" && "
-                      f"ls -la fem_export*.rad && "
-                      f"echo \"Running engine with first available .rad file...\" && "
-                      f"ENGINE_INPUT=\"$(ls fem_export*.rad | sort | head -1)\" && "
-                      f"echo \"Using input file: $ENGINE_INPUT\" && "
-                      f"'/home/nemo/Dokumente/Software/OpenRadioss_linux64/OpenRadioss/exec/engine_linux64_gf' -i \"$ENGINE_INPUT\"")
-
-            command_text.setPlainText(command)
-            layout.addWidget(command_text)
-
-            # Additional instructions
-            instructions_label = QtGui.QLabel("Instructions:\n"
-                                           "1. Copy the command above\n"
-                                           "2. Open a terminal and run the command\n"
-                                           "3. The command sets up proper environment variables\n"
-                                           "4. Creates a temp directory in /tmp\n"
-                                           "5. Files are copied from home directory to /tmp\n"
-                                           "6. Starter processes the K-file and generates .rad files\n"
-                                           "7. Engine automatically detects and uses the correct .rad file\n"
-                                           "8. Check the output files (.out, .msg, .sta) in /tmp")
-            instructions_label.setWordWrap(True)
-            layout.addWidget(instructions_label)
-
-            # Buttons
-            button_layout = QtGui.QHBoxLayout()
-
-            copy_button = QtGui.QPushButton("Copy Command")
-            copy_button.clicked.connect(lambda: QtGui.QApplication.clipboard().setText(command))
-            button_layout.addWidget(copy_button)
-
-            close_button = QtGui.QPushButton("Close")
-            close_button.clicked.connect(dialog.accept)
-            button_layout.addWidget(close_button)
+            self._failure_command_text.setPlainText(_manual_solver_command(
+                self._install_dir, self._solver_env["OMP_NUM_THREADS"], temp_work_dir, k_file_path
+            ))
 
-            layout.addLayout(button_layout)
-            dialog.setLayout(layout)
-            dialog.exec_()
+            self._failure_dialog.exec_()
 
         except Exception as e:
             FreeCAD.Console.PrintError(f"Error showing failure popup: {e}\n")
             # Fallback to simple message box
             QtGui.QMessageBox.warning(self, "Solver Failed",
-                                    "The solver execution failed. Please run OpenRadioss manually in the terminal.")
\ No newline at end of file
+                                    "The solver execution failed. Please run OpenRadioss manually in the terminal.")
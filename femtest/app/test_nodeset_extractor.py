@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+__title__ = "Nodeset extractor FEM unit tests"
+__url__ = "https://www.freecad.org"
+
+import unittest
+
+from femutils.nodeset_extractor.nodeset_utils import _node_lines
+from .support_utils import fcc_print
+
+
+class TestNodesetLines(unittest.TestCase):
+    fcc_print("import TestNodesetLines")
+
+    # ********************************************************************************************
+    def test_00print(self):
+        # since method name starts with 00 this will be run first
+        # this test just prints a line with stars
+
+        fcc_print(
+            "\n{0}\n{1} run FEM TestNodesetLines tests {2}\n{0}".format(
+                100 * "*", 10 * "*", 58 * "*"
+            )
+        )
+
+    # ********************************************************************************************
+    def test_string_ids(self):
+        # the comma separated string returned by the extractors, 10 IDs per line
+        # whatever the number of digits of the IDs
+        nodes = ",".join(map(str, range(95, 118)))
+        self.assertEqual(
+            _node_lines(nodes, 10),
+            [
+                "95 96 97 98 99 100 101 102 103 104",
+                "105 106 107 108 109 110 111 112 113 114",
+                "115 116 117",
+            ],
+        )
+
+    # ********************************************************************************************
+    def test_empty_string(self):
+        self.assertEqual(_node_lines("", 10), [])
+
+    # ********************************************************************************************
+    def test_iterable_ids(self):
+        # node IDs not given as string, from a generator to check they are read only once
+        self.assertEqual(
+            _node_lines((node_id for node_id in (7, 3, 11, 5, 2)), 2),
+            ["7 3", "11 5", "2"],
+        )
+
+    # ********************************************************************************************
+    def test_full_lines(self):
+        # a multiple of per_line leaves no shorter last line
+        self.assertEqual(_node_lines("1,2,3,4,5,6", 3), ["1 2 3", "4 5 6"])
@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+__title__ = "Solver OpenRadioss FEM unit tests"
+__url__ = "https://www.freecad.org"
+
+import unittest
+
+from femtools.runORtools import _StdoutScan
+from .support_utils import fcc_print
+
+
+# solver output reporting both errors, the element numbers are on the lines after the errors
+ERROR_OUTPUT = (
+    " Reading the input\n"
+    " *ERROR in calinput: no material was assigned\n"
+    "        to element 7\n"
+    " *ERROR in calinput: no material was assigned\n"
+    "        to element 12\n"
+    " *ERROR in e_c3d: nonpositive jacobian\n"
+    "        determinant in element 3\n"
+    " *ERROR in e_c3d: nonpositive jacobian\n"
+    "        determinant in element 41\n"
+)
+
+
+def baseline_scan(stdout):
+    """Return the flags and element sets of the whole-text parse _StdoutScan replaced"""
+    no_material = " *ERROR in calinput: no material was assigned" in stdout
+    nonpositive_jacobian = "*ERROR in e_c3d: nonpositive jacobian" in stdout
+    lines = stdout.splitlines()
+    no_material_elements = set()
+    if no_material:
+        no_material_elements = {int(ln.split()[2]) for ln in lines if "to element" in ln}
+    nonpositive_jacobian_elements = set()
+    if nonpositive_jacobian:
+        nonpositive_jacobian_elements = {
+            int(ln.split()[3]) for ln in lines if "determinant in element" in ln
+        }
+    return no_material, nonpositive_jacobian, no_material_elements, nonpositive_jacobian_elements
+
+
+def scan_result(scan):
+    return (
+        scan.no_material,
+        scan.nonpositive_jacobian,
+        scan.no_material_elements,
+        scan.nonpositive_jacobian_elements,
+    )
+
+
+class TestStdoutScan(unittest.TestCase):
+    fcc_print("import TestStdoutScan")
+
+    # ********************************************************************************************
+    def test_00print(self):
+        # since method name starts with 00 this will be run first
+        # this test just prints a line with stars
+
+        fcc_print(
+            "\n{0}\n{1} run FEM TestStdoutScan tests {2}\n{0}".format(100 * "*", 10 * "*", 60 * "*")
+        )
+
+    # ********************************************************************************************
+    def test_lines_split_between_chunks(self):
+        # every split point, in the middle of an error line or of an element number too
+        expected = baseline_scan(ERROR_OUTPUT)
+        data = ERROR_OUTPUT.encode()
+        for split in range(1, len(data)):
+            scan = _StdoutScan()
+            scan.feed(data[:split])
+            scan.feed(data[split:])
+            scan.close()
+            self.assertEqual(scan_result(scan), expected, f"output split at {split}")
+
+    # ********************************************************************************************
+    def test_last_line_without_newline(self):
+        output = ERROR_OUTPUT.rstrip("\n")
+        scan = _StdoutScan()
+        scan.feed(output.encode())
+        # the last element is only scanned once the output is complete
+        self.assertNotIn(41, scan.nonpositive_jacobian_elements)
+        scan.close()
+        self.assertEqual(scan_result(scan), baseline_scan(output))
+
+    # ********************************************************************************************
+    def test_no_errors(self):
+        output = " Reading the input\n Job finished\n"
+        scan = _StdoutScan()
+        scan.feed(output.encode())
+        scan.close()
+        self.assertEqual(scan_result(scan), baseline_scan(output))
+        self.assertEqual(scan_result(scan), (False, False, set(), set()))
@@ -18,12 +18,14 @@ make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_common
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_femimport
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_material
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_nodeset_extractor
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_object
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_open
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_calculix
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_elmer
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_mystran
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_openradioss
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_z88
 
 
@@ -36,6 +38,7 @@ make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_material.TestMaterialUnits
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshCommon
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshEleTetra10
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshGroups
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_nodeset_extractor.TestNodesetLines
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_object.TestObjectCreate
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_object.TestObjectType
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_open.TestObjectOpen
@@ -43,6 +46,7 @@ make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result.TestResult
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_calculix.TestSolverCalculix
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_elmer.TestSolverElmer
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_mystran.TestSolverMystran
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_openradioss.TestStdoutScan
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_z88.TestSolverZ88
 
 
@@ -68,6 +72,10 @@ make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshEleTetra10.test_t
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshGroups.test_add_groups
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshGroups.test_delete_groups
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshGroups.test_add_group_elements
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_nodeset_extractor.TestNodesetLines.test_string_ids
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_nodeset_extractor.TestNodesetLines.test_empty_string
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_nodeset_extractor.TestNodesetLines.test_iterable_ids
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_nodeset_extractor.TestNodesetLines.test_full_lines
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_object.TestObjectCreate.test_femobjects_make
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_object.TestObjectType.test_femobjects_type
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_object.TestObjectType.test_femobjects_isoftype
@@ -121,6 +129,9 @@ make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_mystran.TestSolverMystr
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_mystran.TestSolverMystran.test_ccx_cantilever_faceload
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_mystran.TestSolverMystran.test_ccx_cantilever_nodeload
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_mystran.TestSolverMystran.test_mystran_plate
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_openradioss.TestStdoutScan.test_lines_split_between_chunks
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_openradioss.TestStdoutScan.test_last_line_without_newline
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_openradioss.TestStdoutScan.test_no_errors
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_z88.TestSolverZ88.test_ccx_cantilever_ele_hexa20
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_z88.TestSolverZ88.test_ccx_cantilever_ele_tria6
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_z88.TestSolverZ88.test_ccx_cantilever_faceload
@@ -234,6 +245,26 @@ unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_mesh.TestMeshGroups.test_add_group_elements'
 ))
 
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_nodeset_extractor.TestNodesetLines.test_string_ids'
+))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_nodeset_extractor.TestNodesetLines.test_empty_string'
+))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_nodeset_extractor.TestNodesetLines.test_iterable_ids'
+))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_nodeset_extractor.TestNodesetLines.test_full_lines'
+))
+
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_object.TestObjectCreate.test_femobjects_make'
@@ -499,6 +530,21 @@ unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_solver_mystran.TestSolverMystran.test_mystran_plate'
 ))
 
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_solver_openradioss.TestStdoutScan.test_lines_split_between_chunks'
+))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_solver_openradioss.TestStdoutScan.test_last_line_without_newline'
+))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_solver_openradioss.TestStdoutScan.test_no_errors'
+))
+
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_solver_z88.TestSolverZ88.test_ccx_cantilever_ele_hexa20'
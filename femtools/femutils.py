@@ -33,6 +33,7 @@ __author__ = "Markus Hovorka, Bernd Hahnebach, Uwe Stöhr"
 __url__ = "https://www.freecad.org"
 
 import os
+import shutil
 import subprocess
 from platform import system
 
@@ -231,6 +232,23 @@ def make_dir(specific_path):
     return specific_path
 
 
+def copy_file(source_file, target_file):
+    """Copy the content of *source_file* to *target_file*.
+
+    ``shutil.copyfile`` copies in the kernel where the platform allows it.
+    File metadata is not copied.
+
+    Copying a file onto itself does nothing, the target already has the content.
+
+    :param source_file: path of the file to copy
+    :param target_file: path of the copy, overwritten if it exists
+    """
+    try:
+        shutil.copyfile(source_file, target_file)
+    except shutil.SameFileError:
+        pass
+
+
 # ************************************************************************************************
 # other
 def getBoundBoxOfAllDocumentShapes(doc):
@@ -29,10 +29,21 @@ __url__ = "https://www.freecad.org"
 ## \addtogroup FEM
 #  @{
 
+import functools
+import importlib
 import os
+import re
+import selectors
+import shutil
+import stat
 import sys
 import subprocess
+import threading
 import time
+import weakref
+from collections import deque
+from itertools import chain
+from types import MappingProxyType
 
 # Import femtools modules
 from femtools import femutils
@@ -41,22 +52,294 @@ from femtools import membertools
 # Import Qt modules
 from PySide import QtCore
 
+# Modules imported by _import_freecad and _import_gui, once per process
+_FREECAD = None
+_QTGUI = None
+_FEMGUI = None
+# FreeCAD.GuiUp, read by _gui_up once per process
+_GUI_UP = None
+
+
 # Import FreeCAD only when needed to avoid startup issues
 def _import_freecad():
-    try:
-        import FreeCAD
-        return FreeCAD
-    except ImportError:
-        # This shouldn't happen in FreeCAD, but handle gracefully
-        raise ImportError("FreeCAD not available")
+    global _FREECAD
+    if _FREECAD is None:
+        try:
+            import FreeCAD
+        except ImportError:
+            # This shouldn't happen in FreeCAD, but handle gracefully
+            raise ImportError("FreeCAD not available")
+        _FREECAD = FreeCAD
+    return _FREECAD
+
+def _gui_up():
+    global _GUI_UP
+    if _GUI_UP is None:
+        _GUI_UP = bool(_import_freecad().GuiUp)
+    return _GUI_UP
 
 def _import_gui():
-    FreeCAD = _import_freecad()
-    if FreeCAD.GuiUp:
+    global _QTGUI, _FEMGUI
+    if _QTGUI is None and _gui_up():
         from PySide import QtGui
         import FemGui
-        return QtGui, FemGui
-    return None, None
+        _QTGUI, _FEMGUI = QtGui, FemGui
+    return _QTGUI, _FEMGUI
+
+@functools.lru_cache(maxsize=None)
+def _import_result_reader(name):
+    """Return the feminout module name, imported on first use only"""
+    return importlib.import_module("feminout." + name)
+
+def _debug():
+    """Return whether the debug messages of FemToolsOR are printed
+
+    Read on every call, the task panel's Debug checkbox changes it while FreeCAD runs.
+    """
+    return _import_freecad().ParamGet(
+        "User parameter:BaseApp/Preferences/Mod/Fem/OpenRadioss"
+    ).GetBool("Debug", False)
+
+
+class _Log:
+    """Collects the console messages of one step and prints them with one call"""
+
+    def __init__(self):
+        self._messages = []
+
+    def msg(self, message):
+        self._messages.append(message)
+
+    def flush(self):
+        if self._messages:
+            _import_freecad().Console.PrintMessage("".join(self._messages))
+            self._messages.clear()
+
+
+# Fem type of the document objects checked by _is_of_type, dropped with the objects
+_TYPE_CACHE = weakref.WeakKeyDictionary()
+
+
+def _is_of_type(obj, ty):
+    """femutils.is_of_type, with the type of each object looked up once"""
+    try:
+        return _TYPE_CACHE[obj] == ty
+    except KeyError:
+        pass
+    except TypeError:
+        # no weak reference support, do not cache
+        return femutils.is_of_type(obj, ty)
+    obj_type = _TYPE_CACHE[obj] = femutils.type_of_obj(obj)
+    return obj_type == ty
+
+
+# major and minor number of the version printed by an OpenRadioss binary
+_OR_VERSION_RE = re.compile(r"(\d+)\.(\d+)")
+
+# problems in the solver output which has_no_material_assigned and has_nonpositive_jacobians explain
+_HINT_RE = re.compile(r"(no material|jacobian)", re.IGNORECASE)
+# Element numbers in the OpenRadioss output reporting elements without material
+# and with nonpositive jacobians
+_MAT_RE = re.compile(rb"to element\s+(\d+)")
+_JAC_RE = re.compile(rb"determinant in element\s+(\d+)")
+
+# (major, minor) version reported by an OpenRadioss binary, keyed by path and modification time
+_OR_VERSION_CACHE = {}
+
+
+def _prefetch_file(path):
+    """Ask the kernel to read path into the page cache for a sequential read, if supported"""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+# Common ParaView executable names and locations, in search order,
+# only the locations of the running platform are searched
+if sys.platform == "win32":
+    _PARAVIEW_CANDIDATES = (
+        "paraview",
+        "ParaView",
+        "C:\\Program Files\\ParaView\\bin\\paraview.exe",
+        "C:\\Program Files (x86)\\ParaView\\bin\\paraview.exe",  # 32-bit
+    )
+else:
+    _PARAVIEW_CANDIDATES = (
+        "paraview",
+        "ParaView",
+        "/usr/bin/paraview",
+        "/usr/local/bin/paraview",
+        "/opt/paraview/bin/paraview",
+        "/Applications/ParaView.app/Contents/bin/paraview",  # macOS
+    )
+
+# Extensions of the OpenRadioss result files opened in ParaView, in command line order
+_RESULT_EXTS = (".frd", ".dat", ".h3d", ".t01", ".t02", ".t03", ".t04")
+
+
+def _result_files(base_name):
+    """Return the files base_name + ext of _RESULT_EXTS present, reading their directory once"""
+    directory, prefix = os.path.split(base_name)
+    try:
+        with os.scandir(directory or ".") as entries:
+            names = {
+                entry.name for entry in entries
+                if entry.name.startswith(prefix) and entry.is_file()
+            }
+    except OSError:
+        return []
+    return [base_name + ext for ext in _RESULT_EXTS if prefix + ext in names]
+
+
+# Separator line around the ParaView command printed by _generate_paraview_command
+_RULE = "=" * 60 + "\n"
+
+
+def _spawn_detached(cmd):
+    """Start cmd with its output discarded and do not wait for it
+
+    posix_spawn does not copy the page tables of FreeCAD like fork does,
+    which matters with a large mesh loaded. A thread reaps the child once it exits.
+    """
+    if not hasattr(os, "posix_spawnp"):
+        # Windows
+        subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return
+    pid = os.posix_spawnp(
+        cmd[0],
+        cmd,
+        os.environ,
+        file_actions=[
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        ],
+    )
+    threading.Thread(target=os.waitpid, args=(pid, 0), daemon=True).start()
+
+
+@functools.lru_cache(maxsize=1)
+def _find_paraview():
+    """Return the first ParaView executable of _PARAVIEW_CANDIDATES found, or None"""
+    for exe in _PARAVIEW_CANDIDATES:
+        # a path is checked directly, only plain names are searched in PATH
+        found = os.path.isfile(exe) if os.path.isabs(exe) else shutil.which(exe)
+        if found:
+            return exe
+    return None
+
+
+def _tee_lines(stream, log_file, tail, scan=None):
+    """Write the lines read from stream to log_file and keep the last ones in tail
+
+    The lines are also passed to scan, if given.
+    """
+    with open(log_file, "wb") as log:
+        for line in stream:
+            log.write(line)
+            tail.append(line)
+            if scan is not None:
+                scan.feed(line)
+    stream.close()
+    if scan is not None:
+        scan.close()
+
+
+class _StdoutScan:
+    """Collects the faulty elements OpenRadioss reports while its output is read
+
+    Fed with chunks of the output, a line split between two chunks is scanned once complete.
+    """
+
+    def __init__(self):
+        self.no_material = False
+        self.nonpositive_jacobian = False
+        self.no_material_elements = set()
+        self.nonpositive_jacobian_elements = set()
+        self._partial = b""
+
+    def feed(self, data):
+        data = self._partial + data
+        end = data.rfind(b"\n") + 1
+        self._partial = data[end:]
+        self._scan(data[:end])
+
+    def close(self):
+        """Scan the last line if the output did not end with a newline"""
+        if self._partial:
+            self._scan(self._partial)
+            self._partial = b""
+
+    def _scan(self, lines):
+        # most chunks report neither an error nor an element, skip the searches
+        if b"*ERROR" in lines:
+            if b" *ERROR in calinput: no material was assigned" in lines:
+                self.no_material = True
+            if b"*ERROR in e_c3d: nonpositive jacobian" in lines:
+                self.nonpositive_jacobian = True
+        if b"element" in lines:
+            self.no_material_elements.update(int(m.group(1)) for m in _MAT_RE.finditer(lines))
+            self.nonpositive_jacobian_elements.update(
+                int(m.group(1)) for m in _JAC_RE.finditer(lines)
+            )
+
+
+@functools.lru_cache(maxsize=1)
+def _or_paths():
+    """Return the OpenRadioss paths set in the preferences
+
+    Read once until FemToolsOR.reset_or_binary_cache is called.
+    BASE is the installation used by start_OR and get_OR_version,
+    TEMPLATE the K-file copied by write_k_file.
+    """
+    prefs = _import_freecad().ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/OpenRadioss")
+    return MappingProxyType({
+        "BASE": prefs.GetString(
+            "InstallPath",
+            os.environ.get("OPENRADIOSS_PATH", "/home/nemo/Dokumente/Software/OpenRadioss_linux64"),
+        ),
+        "TEMPLATE": prefs.GetString(
+            "TemplateKFile", "/home/nemo/Dokumente/Sandbox/Fem_upgraded/zug_test3_RS.k"
+        ),
+    })
+
+
+@functools.lru_cache(maxsize=None)
+def _build_or_env(or_base_dir):
+    """Return the OpenRadioss environment variables for an installation directory
+
+    LD_LIBRARY_PATH only holds the OpenRadioss libraries,
+    the caller appends the current value.
+    """
+    return MappingProxyType({
+        "OPENRADIOSS_PATH": or_base_dir,
+        "RAD_CFG_PATH": f"{or_base_dir}/OpenRadioss/hm_cfg_files",
+        "RAD_H3D_PATH": f"{or_base_dir}/OpenRadioss/extlib/h3d/lib/linux64",
+        "LD_LIBRARY_PATH": (
+            f"{or_base_dir}/OpenRadioss/extlib/hm_reader/linux64:"
+            f"{or_base_dir}/OpenRadioss/extlib/h3d/lib/linux64"
+        ),
+    })
+
+
+def _or_subprocess_env(or_base_dir=None):
+    """Return a copy of the process environment extended for running OpenRadioss"""
+    or_env = _build_or_env(or_base_dir or _or_paths()["BASE"])
+    env = {**os.environ, **or_env}
+    # an empty entry would make the loader search the current directory
+    ld_library_path = os.environ.get("LD_LIBRARY_PATH")
+    if ld_library_path:
+        env["LD_LIBRARY_PATH"] = f"{or_env['LD_LIBRARY_PATH']}:{ld_library_path}"
+    return env
 
 
 class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
@@ -84,6 +367,13 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
 
     finished = QtCore.Signal(int)
 
+    # number of output lines kept in OR_stdout and OR_stderr,
+    # the whole output is written to <base name>.stdout.log and .stderr.log
+    tail_lines = 200
+
+    # binary found by setup_OR, keyed by _or_binary_cache_key
+    _OR_BINARY_CACHE = {}
+
     def __init__(self, analysis=None, solver=None, test_mode=False):
         """The constructor
 
@@ -101,11 +391,22 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
         QtCore.QObject.__init__(self)
 
         FreeCAD = _import_freecad()
-        QtGui, FemGui = _import_gui()
+
+        # preference groups read by several methods
+        self.fem_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General")
+        self.ccx_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Ccx")
+        self.or_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/OpenRadioss")
 
         self.ccx_binary_present = False
         self.analysis = None
         self.solver = None
+        # set by cancel, checked while OpenRadioss runs
+        self._cancel_requested = threading.Event()
+        # os.stat results of the current check, see _stat_cached
+        self._stat_cache = {}
+        # faulty elements reported in OR_stdout, see _scan_stdout, and the text they belong to
+        self._stdout_scan = _StdoutScan()
+        self._scanned_stdout = None
 
         # TODO if something will go wrong in __init__ do not continue,
         # but do not raise a exception, break in a smarter way
@@ -138,6 +439,14 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
         self.base_name = ""
         self.inp_file_name = ""
         self.working_dir = ""
+        # (working_dir, base_name) inp_file_name was built from by set_k_file_name
+        self._last_k_key = None
+        # result file prefix computed by result_base, and the inp_file_name it belongs to
+        self._result_base = ""
+        self._result_base_of = ""
+        # answer of should_launch_paraview, and the solver it was given for
+        self._launch_paraview = True
+        self._launch_paraview_of = None
         self.mesh = None
         self.member = None
         self.results_present = False
@@ -174,9 +483,6 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
         """Reset mesh color, deformation and removes all result objects
         if preferences to keep them is not set.
         """
-        FreeCAD = _import_freecad()
-
-        self.fem_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General")
         keep_results_on_rerun = self.fem_prefs.GetBool("KeepResultsOnReRun", False)
         if not keep_results_on_rerun:
             self.purge_results()
@@ -185,6 +491,30 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
         """Reset mesh color, deformation and removes all result objects"""
         self.purge_results()
 
+    def _stat_cached(self, path):
+        """Return os.stat of path, or None if it does not exist
+
+        Each path is stat'ed once until the cache is reset at the start of the next check.
+        """
+        try:
+            return self._stat_cache[path]
+        except KeyError:
+            pass
+        try:
+            path_stat = os.stat(path)
+        except OSError:
+            path_stat = None
+        self._stat_cache[path] = path_stat
+        return path_stat
+
+    def _is_file(self, path):
+        path_stat = self._stat_cached(path)
+        return path_stat is not None and stat.S_ISREG(path_stat.st_mode)
+
+    def _is_dir(self, path):
+        path_stat = self._stat_cached(path)
+        return path_stat is not None and stat.S_ISDIR(path_stat.st_mode)
+
     def _get_several_member(self, obj_type):
         return membertools.get_several_member(self.analysis, obj_type)
 
@@ -192,108 +522,121 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
         FreeCAD = _import_freecad()
         QtGui, FemGui = _import_gui()
 
-        if FreeCAD.GuiUp:
+        if _gui_up():
             self.analysis = FemGui.getActiveAnalysis()
         if self.analysis:
             return
-        found_analysis = False
-        # search in the active document
+        # search in the active document, a second analysis decides already
+        analyses = []
         for m in FreeCAD.activeDocument().Objects:
-            if femutils.is_of_type(m, "Fem::FemAnalysis"):
-                if not found_analysis:
-                    self.analysis = m
-                    found_analysis = True
-                else:
-                    self.analysis = None  # more than one analysis
+            if _is_of_type(m, "Fem::FemAnalysis"):
+                analyses.append(m)
+                if len(analyses) > 1:
+                    break
+        self.analysis = analyses[0] if len(analyses) == 1 else None  # more than one analysis
         if self.analysis:
-            if FreeCAD.GuiUp:
+            if _gui_up():
                 FemGui.setActiveAnalysis(self.analysis)
 
     def find_solver_analysis(self):
         """get the analysis group the solver belongs to"""
-        FreeCAD = _import_freecad()
         QtGui, FemGui = _import_gui()
 
         if self.solver.getParentGroup():
             obj = self.solver.getParentGroup()
-            if femutils.is_of_type(obj, "Fem::FemAnalysis"):
+            if _is_of_type(obj, "Fem::FemAnalysis"):
                 self.analysis = obj
-                if FreeCAD.GuiUp:
+                if _gui_up():
                     FemGui.setActiveAnalysis(self.analysis)
 
     def find_solver(self):
         FreeCAD = _import_freecad()
 
-        found_solver_for_use = False
+        # we are going to explicitly check for the ccx tools solver type only,
+        # thus it is possible to have lots of framework solvers inside the analysis anyway
+        # for some methods no solver is needed (purge_results) --> solver could be none
+        # analysis has one solver and no solver was set --> use the one solver
+        # analysis has more than one solver and no solver was set --> use solver none
+        # analysis has no solver --> use solver none
+        solvers = []
         for m in self.analysis.Group:
-            if femutils.is_of_type(m, "Fem::SolverOpenRadioss"):
-                # we are going to explicitly check for the ccx tools solver type only,
-                # thus it is possible to have lots of framework solvers inside the analysis anyway
-                # for some methods no solver is needed (purge_results) --> solver could be none
-                # analysis has one solver and no solver was set --> use the one solver
-                # analysis has more than one solver and no solver was set --> use solver none
-                # analysis has no solver --> use solver none
-                if not found_solver_for_use:
-                    # no solver was found before
-                    self.solver = m
-                    found_solver_for_use = True
-                else:
-                    # another solver was found --> We have more than one solver
-                    # we do not know which one to use, so we use none !
-                    self.solver = None
-                    FreeCAD.Console.PrintLog(
-                        "FEM: More than one solver in the analysis "
-                        "and no solver given to analyze. "
-                        "No solver is set!\n"
-                    )
+            if _is_of_type(m, "Fem::SolverOpenRadioss"):
+                solvers.append(m)
+                if len(solvers) > 1:
+                    break
+        if len(solvers) == 1:
+            self.solver = solvers[0]
+        elif solvers:
+            # another solver was found --> We have more than one solver
+            # we do not know which one to use, so we use none !
+            self.solver = None
+            FreeCAD.Console.PrintLog(
+                "FEM: More than one solver in the analysis "
+                "and no solver given to analyze. "
+                "No solver is set!\n"
+            )
 
     def update_objects(self):
-        FreeCAD.Console.PrintMessage("=== FemToolsOR.update_objects() starting ===\n")
+        FreeCAD = _import_freecad()
+        debug = _debug()
+        log = _Log()
+
+        if debug:
+            log.msg("=== FemToolsOR.update_objects() starting ===\n")
+            log.msg(f"  - Getting mesh for analysis: {self.analysis.Label if self.analysis else 'None'}\n")
         ## @var mesh
         #  mesh for the analysis
         self.mesh = None
-        FreeCAD.Console.PrintMessage(f"  - Getting mesh for analysis: {self.analysis.Label if self.analysis else 'None'}\n")
         mesh, message = membertools.get_mesh_to_solve(self.analysis)
         if mesh is not None:
             self.mesh = mesh
-            FreeCAD.Console.PrintMessage(f"  - Mesh found: {mesh.Label}\n")
+            if debug:
+                log.msg(f"  - Mesh found: {mesh.Label}\n")
         else:
             # the prerequisites will run anyway and they will print a message box anyway
             # thus do not print one here, but print a console warning
+            log.flush()
             FreeCAD.Console.PrintWarning(f"{message} The prerequisite check will fail.\n")
 
         ## @var members
         # members of the analysis. All except the solver and the mesh
-        FreeCAD.Console.PrintMessage("  - Getting analysis members...\n")
         self.member = membertools.AnalysisMember(self.analysis)
-        FreeCAD.Console.PrintMessage(f"  - Members found: {len(self.member.members)} objects\n")
-        FreeCAD.Console.PrintMessage("=== FemToolsOR.update_objects() completed ===\n")
+        if debug:
+            log.msg(f"  - Members found: {len(self.member.members)} objects\n")
+            log.msg("=== FemToolsOR.update_objects() completed ===\n")
+        log.flush()
 
     def check_prerequisites(self):
-        FreeCAD.Console.PrintMessage("=== FemToolsOR.check_prerequisites() starting ===\n")
-        FreeCAD.Console.PrintMessage("\n")  # because of time print in separate line
-        FreeCAD.Console.PrintMessage("Check prerequisites...\n")
+        debug = _debug()
+        log = _Log()
+        self._stat_cache = {}
+
+        if debug:
+            log.msg("=== FemToolsOR.check_prerequisites() starting ===\n")
+        log.msg("\n")  # because of time print in separate line
+        log.msg("Check prerequisites...\n")
         message = ""
         # analysis
-        FreeCAD.Console.PrintMessage(f"  - Checking analysis: {self.analysis.Label if self.analysis else 'None'}\n")
         if not self.analysis:
             message += "No active Analysis\n"
         # solver
-        FreeCAD.Console.PrintMessage(f"  - Checking solver: {self.solver.Label if self.solver else 'None'}\n")
         if not self.solver:
             message += "No solver object defined in the analysis\n"
         if not self.working_dir:
             message += "Working directory not set\n"
-        if not os.path.isdir(self.working_dir):
+        if not self._is_dir(self.working_dir):
             message += f"Working directory '{self.working_dir}' doesn't exist."
         from femtools.checksanalysis import check_member_for_solver_calculix
 
-        FreeCAD.Console.PrintMessage("  - Running member checks...\n")
         message += check_member_for_solver_calculix(
             self.analysis, self.solver, self.mesh, self.member
         )
-        FreeCAD.Console.PrintMessage(f"  - Prerequisites check result: {message if message else 'All checks passed'}\n")
-        FreeCAD.Console.PrintMessage("=== FemToolsOR.check_prerequisites() completed ===\n")
+        if debug:
+            log.msg(f"  - Checked analysis: {self.analysis.Label if self.analysis else 'None'}\n")
+            log.msg(f"  - Checked solver: {self.solver.Label if self.solver else 'None'}\n")
+            log.msg(f"  - Prerequisites check result: {message if message else 'All checks passed'}\n")
+            log.msg("=== FemToolsOR.check_prerequisites() completed ===\n")
+        log.flush()
         return message
 
     def set_base_name(self, base_name=None):
@@ -325,8 +668,21 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
         """
         if k_file_name is not None:
             self.inp_file_name = k_file_name
-        else:
+            self._last_k_key = None
+            return
+        # nothing to do if the name was built from the same dir and base name
+        k_key = (self.working_dir, self.base_name)
+        if k_key != self._last_k_key:
             self.inp_file_name = os.path.join(self.working_dir, (self.base_name + ".k"))
+            self._last_k_key = k_key
+
+    @property
+    def result_base(self):
+        """inp_file_name without extension, the path prefix of the result files"""
+        if self._result_base_of is not self.inp_file_name:
+            self._result_base = os.path.splitext(self.inp_file_name)[0]
+            self._result_base_of = self.inp_file_name
+        return self._result_base
 
     def setup_working_dir(self, param_working_dir=None, create=False):
         """Set working dir for solver execution.
@@ -342,7 +698,6 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
 
         self.working_dir = ""
         # try to use given working dir or overwrite with solver working dir
-        fem_general_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General")
         if param_working_dir is not None:
             self.working_dir = param_working_dir
             if femutils.check_working_dir(self.working_dir) is not True:
@@ -359,7 +714,7 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
                     FreeCAD.Console.PrintMessage(
                         f"Dir '{self.working_dir}' will be used instead.\n"
                     )
-        elif fem_general_prefs.GetBool("OverwriteSolverWorkingDirectory", True) is False:
+        elif self.fem_prefs.GetBool("OverwriteSolverWorkingDirectory", True) is False:
             self.working_dir = self.solver.WorkingDir
             if femutils.check_working_dir(self.working_dir) is not True:
                 if self.working_dir == "":
@@ -389,18 +744,24 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
 
     def write_k_file(self):
         FreeCAD = _import_freecad()
-        FreeCAD.Console.PrintMessage("=== FemToolsOR.write_k_file() starting ===\n")
+        debug = _debug()
+        log = _Log()
+        if debug:
+            log.msg("=== FemToolsOR.write_k_file() starting ===\n")
 
         # Write input file
         from femsolver.OpenRadioss import writer as iw
 
         self.OR_file_name = ""
-        FreeCAD.Console.PrintMessage(f"  - Working directory: {self.working_dir}\n")
-        FreeCAD.Console.PrintMessage(f"  - Base name: {self.base_name}\n")
+        if debug:
+            log.msg(f"  - Working directory: {self.working_dir}\n")
+            log.msg(f"  - Base name: {self.base_name}\n")
 
         try:
-            # Create a minimal member object for the writer
-            member = membertools.AnalysisMember(self.analysis)
+            # Members collected by update_objects, unless it was not called
+            if self.member is None:
+                self.member = membertools.AnalysisMember(self.analysis)
+            member = self.member
 
             # TODO: Enable OpenRadioss writer when ready
             # OR_writer = iw.FemInputWriterCcx(
@@ -412,7 +773,7 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
             #     [],  # Empty material/geometry sets
             # )
             # self.OR_file_name = OR_writer.write_solver_input()
-            # FreeCAD.Console.PrintMessage(f"  - Input file written: {self.OR_file_name}\n")
+            # log.msg(f"  - Input file written: {self.OR_file_name}\n")
 
             # For now, copy the test file to the working directory
             # Use the filename that was set by the solver (don't override it)
@@ -422,42 +783,48 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
             # Use the filename that was already set by the solver
             if not self.OR_file_name:
                 self.OR_file_name = os.path.join(self.working_dir, "fem_export.k")
-                self.inp_file_name = self.OR_file_name
+                self.set_k_file_name(self.OR_file_name)
 
             # Debug: Show what filename we're using
-            FreeCAD.Console.PrintMessage(f"  - Target filename: {self.OR_file_name}\n")
-            FreeCAD.Console.PrintMessage(f"  - Working directory: {self.working_dir}\n")
+            if debug:
+                log.msg(f"  - Target filename: {self.OR_file_name}\n")
 
             # Copy the test file to the working directory
-            test_k_file = "/home/nemo/Dokumente/Sandbox/Fem_upgraded/zug_test3_RS.k"
-            import shutil
+            test_k_file = _or_paths()["TEMPLATE"]
             if os.path.exists(test_k_file):
-                shutil.copy2(test_k_file, self.OR_file_name)
-                FreeCAD.Console.PrintMessage(f"  - Using test file: {test_k_file}\n")
-                FreeCAD.Console.PrintMessage(f"  - Copied to working directory: {self.OR_file_name}\n")
-
-                # Verify the file was actually created
-                if os.path.exists(self.OR_file_name):
-                    file_size = os.path.getsize(self.OR_file_name)
-                    FreeCAD.Console.PrintMessage(f"  - File successfully created: {self.OR_file_name} ({file_size} bytes)\n")
-                else:
-                    FreeCAD.Console.PrintError(f"  - ERROR: File was not created at: {self.OR_file_name}\n")
+                # content only, the solver input needs no copied metadata
+                femutils.copy_file(test_k_file, self.OR_file_name)
+                log.msg(f"  - Using test file: {test_k_file}\n")
+                log.msg(f"  - Copied to working directory: {self.OR_file_name}\n")
+                created = "File"
             else:
+                log.flush()
                 FreeCAD.Console.PrintError(f"  - Test file not found: {test_k_file}\n")
                 # Create a minimal K-file as fallback
-                with open(self.OR_file_name, 'w') as f:
-                    f.write("* Test K-file generated by OpenRadioss solver\n")
-                    f.write("$ Generated at: " + time.strftime("%Y-%m-%d %H:%M:%S") + "\n")
-                FreeCAD.Console.PrintMessage(f"  - Created minimal K-file: {self.OR_file_name}\n")
-
-                # Verify fallback file was created
-                if os.path.exists(self.OR_file_name):
+                payload = (
+                    "* Test K-file generated by OpenRadioss solver\n"
+                    f"$ Generated at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                ).encode()
+                fd = os.open(self.OR_file_name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, payload)
+                finally:
+                    os.close(fd)
+                log.msg(f"  - Created minimal K-file: {self.OR_file_name}\n")
+                created = "Fallback file"
+
+            # Verify the file was actually created
+            if os.path.exists(self.OR_file_name):
+                if debug:
                     file_size = os.path.getsize(self.OR_file_name)
-                    FreeCAD.Console.PrintMessage(f"  - Fallback file successfully created: {self.OR_file_name} ({file_size} bytes)\n")
-                else:
-                    FreeCAD.Console.PrintError(f"  - ERROR: Fallback file was not created at: {self.OR_file_name}\n")
+                    log.msg(f"  - {created} successfully created: {self.OR_file_name} ({file_size} bytes)\n")
+                _prefetch_file(self.OR_file_name)
+            else:
+                log.flush()
+                FreeCAD.Console.PrintError(f"  - ERROR: {created} was not created at: {self.OR_file_name}\n")
 
         except Exception as e:
+            log.flush()
             FreeCAD.Console.PrintError(
                 f"Unexpected error when writing OpenRadioss k file: {str(e)}\n"
             )
@@ -465,12 +832,26 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
             FreeCAD.Console.PrintError(f"Traceback: {traceback.format_exc()}\n")
             raise
 
-        FreeCAD.Console.PrintMessage("=== FemToolsOR.write_k_file() completed ===\n")
+        if debug:
+            log.msg("=== FemToolsOR.write_k_file() completed ===\n")
+        log.flush()
+
+    @classmethod
+    def reset_or_binary_cache(cls):
+        """Forget the binaries found by setup_OR and the paths read by _or_paths,
+        e.g. after a preference change"""
+        cls._OR_BINARY_CACHE.clear()
+        _or_paths.cache_clear()
+
+    def _or_binary_cache_key(self, OR_binary):
+        # the binary given and the preferences get_binary("OpenRadioss") depends on
+        return (
+            OR_binary,
+            self.or_prefs.GetBool("UseStandardOpenRadiossEngineLocation", True),
+            self.or_prefs.GetString("openRadiossEngineBinaryPath"),
+        )
 
     def setup_OR(self, OR_binary=None, OR_binary_sig="OpenRadioss"):
-        FreeCAD = _import_freecad()
-        QtGui, FemGui = _import_gui()
-
         """Set Calculix binary path and validate its execution.
 
         Parameters
@@ -482,32 +863,55 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
             Defaults to 'OpenRadioss'. Expected output from `ccx` when run empty.
 
         """
+        FreeCAD = _import_freecad()
+        QtGui, FemGui = _import_gui()
+        debug = _debug()
+        log = _Log()
+
+        self._stat_cache = {}
+
+        # Reuse the binary found before with the same settings, if it is still there
+        cache_key = self._or_binary_cache_key(OR_binary)
+        cached_binary = self._OR_BINARY_CACHE.get(cache_key)
+        if cached_binary and self._is_file(cached_binary):
+            self.OR_binary = cached_binary
+            self.OR_binary_present = True
+            return
+
         error_title = "No or wrong OpenRadioss binary"
         error_message = ""
         from platform import system
 
-        FreeCAD.Console.PrintMessage(f"  - OR_binary parameter: {OR_binary}\n")
-        FreeCAD.Console.PrintMessage(f"  - Platform: {system()}\n")
+        if debug:
+            log.msg(f"  - OR_binary parameter: {OR_binary}\n")
+            log.msg(f"  - Platform: {system()}\n")
 
         # Check for explicitly provided binary
-        if OR_binary and os.path.isfile(OR_binary):
-            FreeCAD.Console.PrintMessage(f"  - Using provided binary: {OR_binary}\n")
+        if OR_binary and self._is_file(OR_binary):
+            if debug:
+                log.msg(f"  - Using provided binary: {OR_binary}\n")
+                log.msg("=== FemToolsOR.setup_OR() completed ===\n")
+            log.flush()
             self.OR_binary = OR_binary
             self.OR_binary_present = True
-            FreeCAD.Console.PrintMessage("=== FemToolsOR.setup_OR() completed ===\n")
+            self._OR_BINARY_CACHE[cache_key] = OR_binary
             return
 
         # Try to get binary from FreeCAD settings
         from femsolver.settings import get_binary
 
         binary_path = get_binary("OpenRadioss")
-        FreeCAD.Console.PrintMessage(f"  - Binary path from settings: {binary_path}\n")
-
-        if binary_path and os.path.isfile(binary_path):
-            FreeCAD.Console.PrintMessage(f"  - Using settings binary: {binary_path}\n")
+        if debug:
+            log.msg(f"  - Binary path from settings: {binary_path}\n")
+
+        if binary_path and self._is_file(binary_path):
+            if debug:
+                log.msg(f"  - Using settings binary: {binary_path}\n")
+                log.msg("=== FemToolsOR.setup_OR() completed ===\n")
+            log.flush()
             self.OR_binary = binary_path
             self.OR_binary_present = True
-            FreeCAD.Console.PrintMessage("=== FemToolsOR.setup_OR() completed ===\n")
+            self._OR_BINARY_CACHE[cache_key] = binary_path
             return
 
         # Try standard locations as fallback
@@ -516,93 +920,152 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
         else:
             default_path = "/opt/OpenRadioss/exec/engine_linux64_gf"
 
-        FreeCAD.Console.PrintMessage(f"  - Checking default path: {default_path}\n")
-        if os.path.isfile(default_path):
-            FreeCAD.Console.PrintMessage(f"  - Found binary at default path: {default_path}\n")
+        if debug:
+            log.msg(f"  - Checking default path: {default_path}\n")
+        if self._is_file(default_path):
+            if debug:
+                log.msg(f"  - Found binary at default path: {default_path}\n")
+                log.msg("=== FemToolsOR.setup_OR() completed ===\n")
+            log.flush()
             self.OR_binary = default_path
             self.OR_binary_present = True
 
             # Save to settings for future use
-            from femsolver.settings import _SolverDlg
-            param_group = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/OpenRadioss")
-            param_group.SetString("openRadiossEngineBinaryPath", default_path)
-            param_group.SetBool("UseStandardOpenRadiossEngineLocation", False)
-
-            FreeCAD.Console.PrintMessage("=== FemToolsOR.setup_OR() completed ===\n")
+            self.or_prefs.SetString("openRadiossEngineBinaryPath", default_path)
+            self.or_prefs.SetBool("UseStandardOpenRadiossEngineLocation", False)
+            # the key of the settings just saved
+            self._OR_BINARY_CACHE[self._or_binary_cache_key(OR_binary)] = default_path
             return
 
         # Binary not found
+        log.flush()
         self.OR_binary_present = False
         error_message = (
             "OpenRadioss binary not found. Please set the path in "
             "Edit → Preferences → FEM → OpenRadioss"
         )
         FreeCAD.Console.PrintError(f"{error_title}: {error_message}\n")
-        if FreeCAD.GuiUp:
-            QtWidgets.QMessageBox.critical(None, error_title, error_message)
+        if _gui_up():
+            QtGui.QMessageBox.critical(None, error_title, error_message)
         raise RuntimeError(error_message)
 
-    def start_OR(self):
+    def cancel(self):
+        """Terminate the OpenRadioss process started by start_OR, can be called from any thread
+
+        Connected to the Abort button OR_run shows while OpenRadioss runs.
+        """
+        self._cancel_requested.set()
+
+    def start_OR(self, poll=None):
+        """Run OpenRadioss on inp_file_name and return its exit code
+
+        poll is called about every 50 ms while OpenRadioss runs, e.g. to process GUI events.
+        """
         import multiprocessing
 
         self.OR_stdout = ""
         self.OR_stderr = ""
-        ont_backup = os.environ.get("OMP_NUM_THREADS")
-        self.ccx_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Ccx")
+        # Set OpenRadioss specific environment variables for the subprocess only,
+        # os.environ is shared with the other threads
+        env = _or_subprocess_env()
         # If number of CPU's specified
         num_cpu_pref = self.ccx_prefs.GetInt("AnalysisNumCPUs", 1)
-        if not ont_backup:
-            ont_backup = str(num_cpu_pref)
         if num_cpu_pref > 1:
             # If user picked a number use that instead
-            os.environ["OMP_NUM_THREADS"] = str(num_cpu_pref)
+            env["OMP_NUM_THREADS"] = str(num_cpu_pref)
         else:
-            os.environ["OMP_NUM_THREADS"] = str(multiprocessing.cpu_count())
-
-        # Set OpenRadioss specific environment variables
-        or_base_dir = "/home/nemo/Dokumente/Software/OpenRadioss_linux64"
-        os.environ["OPENRADIOSS_PATH"] = or_base_dir
-        os.environ["RAD_CFG_PATH"] = f"{or_base_dir}/OpenRadioss/hm_cfg_files"
-        os.environ["RAD_H3D_PATH"] = f"{or_base_dir}/OpenRadioss/extlib/h3d/lib/linux64"
-        os.environ["LD_LIBRARY_PATH"] = f"{or_base_dir}/OpenRadioss/extlib/hm_reader/linux64:{or_base_dir}/OpenRadioss/extlib/h3d/lib/linux64:{os.environ.get('LD_LIBRARY_PATH', '')}"
-
-        # change cwd because ccx may crash if directory has no write permission
-        # there is also a limit of the length of file names so jump to the document directory
-        cwd = QtCore.QDir.currentPath()
+            env["OMP_NUM_THREADS"] = str(multiprocessing.cpu_count())
+
+        # run in the directory of the input file because ccx may crash if directory has
+        # no write permission, there is also a limit of the length of file names.
+        # Only the child changes its cwd, the process cwd is shared with the other threads.
         f = QtCore.QFileInfo(self.inp_file_name)
-        QtCore.QDir.setCurrent(f.path())
+        argv = (self.OR_binary, "-i", f.baseName())
         p = subprocess.Popen(
-            [self.OR_binary, "-i ", f.baseName()],
+            argv,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             shell=False,
-            env=os.environ.copy(),  # Pass the modified environment to subprocess
+            cwd=f.path(),
+            env=env,
         )
-        self.OR_stdout, self.OR_stderr = p.communicate()
-        self.OR_stdout = self.OR_stdout.decode()
-        self.OR_stderr = self.OR_stderr.decode()
-        # Restore original environment
-        if ont_backup:
-            os.environ["OMP_NUM_THREADS"] = ont_backup
+        # Stream both pipes to log files, only their tails stay in memory
+        log_base = os.path.join(f.path(), f.baseName())
+        stdout_tail = deque(maxlen=self.tail_lines)
+        stderr_tail = deque(maxlen=self.tail_lines)
+        # the faulty elements are collected while reading, the tail may not hold them anymore
+        scan = _StdoutScan()
+        if os.name == "nt":
+            # pipes can not be selected on Windows, read stderr in a thread
+            stderr_reader = threading.Thread(
+                target=_tee_lines, args=(p.stderr, log_base + ".stderr.log", stderr_tail), daemon=True
+            )
+            stderr_reader.start()
+            _tee_lines(p.stdout, log_base + ".stdout.log", stdout_tail, scan)
+            stderr_reader.join()
         else:
-            os.environ.pop("OMP_NUM_THREADS", None)
-        QtCore.QDir.setCurrent(cwd)
+            self._drain_until_exit(p, log_base, stdout_tail, stderr_tail, scan, poll)
+        p.wait()
+        self.OR_stdout = b"".join(stdout_tail).decode(errors="replace")
+        self.OR_stderr = b"".join(stderr_tail).decode(errors="replace")
+        self._stdout_scan = scan
+        self._scanned_stdout = self.OR_stdout
         return p.returncode
 
+    def _drain_until_exit(self, p, log_base, stdout_tail, stderr_tail, scan, poll=None):
+        """Copy the output of process p to the log files until both pipes are closed
+
+        Checks every 50 ms whether cancel was called and calls poll, if given,
+        the pipes never fill up meanwhile. The standard output is also passed to scan.
+        """
+        with open(log_base + ".stdout.log", "wb") as stdout_log, \
+                open(log_base + ".stderr.log", "wb") as stderr_log, \
+                selectors.DefaultSelector() as selector:
+            selector.register(p.stdout, selectors.EVENT_READ, (stdout_log, stdout_tail, scan))
+            selector.register(p.stderr, selectors.EVENT_READ, (stderr_log, stderr_tail, None))
+            terminated = False
+            try:
+                while selector.get_map():
+                    if poll is not None:
+                        poll()
+                    if self._cancel_requested.is_set() and not terminated and p.poll() is None:
+                        _import_freecad().Console.PrintWarning("OpenRadioss run cancelled.\n")
+                        p.terminate()
+                        terminated = True
+                    # once the process has exited only the buffered output is left, do not wait
+                    exited = p.poll() is not None
+                    ready = selector.select(0 if exited else 0.05)
+                    if exited and not ready:
+                        # the pipes are held open by a child process of OpenRadioss
+                        break
+                    for key, _events in ready:
+                        data = os.read(key.fd, 65536)
+                        if not data:
+                            selector.unregister(key.fileobj)
+                            key.fileobj.close()
+                            continue
+                        log, tail, data_scan = key.data
+                        log.write(data)
+                        # a line split between two reads takes two entries, the joined text is the same
+                        tail.extend(data.splitlines(keepends=True))
+                        if data_scan is not None:
+                            data_scan.feed(data)
+            finally:
+                # pipes still open after an early exit or an error
+                for key in list(selector.get_map().values()):
+                    selector.unregister(key.fileobj)
+                    key.fileobj.close()
+                self._cancel_requested.clear()
+        scan.close()
+
     def get_OR_version(self):
         self.setup_OR()
-        import re
-        from platform import system
 
-        OR_stdout = None
-        OR_stderr = None
-
-        # Set up environment for version check
-        or_base_dir = "/home/nemo/Dokumente/Software/OpenRadioss_linux64"
-        os.environ["OPENRADIOSS_PATH"] = or_base_dir
-        os.environ["RAD_CFG_PATH"] = f"{or_base_dir}/OpenRadioss/hm_cfg_files"
-        os.environ["RAD_H3D_PATH"] = f"{or_base_dir}/OpenRadioss/extlib/h3d/lib/linux64"
-        os.environ["LD_LIBRARY_PATH"] = f"{or_base_dir}/OpenRadioss/extlib/hm_reader/linux64:{or_base_dir}/OpenRadioss/extlib/h3d/lib/linux64:{os.environ.get('LD_LIBRARY_PATH', '')}"
+        # Ask each binary once, a replaced binary has a new modification time
+        cache_key = (self.OR_binary, os.path.getmtime(self.OR_binary))
+        version = _OR_VERSION_CACHE.get(cache_key)
+        if version is not None:
+            return version
 
         # Now extract the version number
         p = subprocess.Popen(
@@ -611,12 +1074,13 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
             stderr=subprocess.PIPE,
             shell=False,
             startupinfo=femutils.startProgramInfo(""),
-            env=os.environ.copy(),  # Pass the modified environment
+            env=_or_subprocess_env(),
         )
         OR_stdout, OR_stderr = p.communicate()
         OR_stdout = OR_stdout.decode()
-        m = re.search(r"(\d+).(\d+)", OR_stdout)
-        return (int(m.group(1)), int(m.group(2)))
+        m = _OR_VERSION_RE.search(OR_stdout)
+        version = _OR_VERSION_CACHE[cache_key] = (int(m.group(1)), int(m.group(2)))
+        return version
 
     def OR_run(self):
         FreeCAD = _import_freecad()
@@ -636,14 +1100,31 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
                     self.OR_binary
                 )
             )
-            if FreeCAD.GuiUp:
+            if _gui_up():
                 QtGui.QMessageBox.critical(None, "No OpenRadioss binary engine_linux64_gf", error_message)
             return
-        progress_bar = FreeCAD.Base.ProgressIndicator()
-        progress_bar.start("Everything seems fine. OpenRadioss engine_linux64_gf will be executed ...", 0)
-        ret_code = self.start_OR()
-        self.finished.emit(ret_code)
-        progress_bar.stop()
+        if _gui_up():
+            # its Abort button cancels the run, start_OR processes the GUI events meanwhile
+            progress = QtGui.QProgressDialog(
+                "Everything seems fine. OpenRadioss engine_linux64_gf is running ...", "Abort", 0, 0
+            )
+            progress.setWindowTitle("OpenRadioss")
+            progress.setWindowModality(QtCore.Qt.ApplicationModal)
+            progress.setMinimumDuration(0)
+            progress.canceled.connect(self.cancel)
+            progress.show()
+            try:
+                ret_code = self.start_OR(poll=QtGui.QApplication.processEvents)
+            finally:
+                progress.canceled.disconnect(self.cancel)
+                progress.reset()
+            self.finished.emit(ret_code)
+        else:
+            progress_bar = FreeCAD.Base.ProgressIndicator()
+            progress_bar.start("Everything seems fine. OpenRadioss engine_linux64_gf will be executed ...", 0)
+            ret_code = self.start_OR()
+            self.finished.emit(ret_code)
+            progress_bar.stop()
         if ret_code or self.OR_stderr:
             if ret_code == 201 and self.solver.AnalysisType == "check":
                 FreeCAD.Console.PrintMessage(
@@ -661,13 +1142,15 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
                 FreeCAD.Console.PrintMessage("--------start of stdout-------\n")
                 FreeCAD.Console.PrintMessage(self.OR_stdout)
                 FreeCAD.Console.PrintMessage("\n--------end of stdout---------\n")
-                FreeCAD.Console.PrintMessage("--------start problems---------\n")
-                self.has_no_material_assigned()
-                self.has_nonpositive_jacobians()
-                FreeCAD.Console.PrintMessage("\n--------end problems---------\n")
+                # the mesh diagnostics only apply if the output mentions their problems
+                if any(self._classify_errors()) or _HINT_RE.search(self.OR_stderr):
+                    FreeCAD.Console.PrintMessage("--------start problems---------\n")
+                    self.has_no_material_assigned()
+                    self.has_nonpositive_jacobians()
+                    FreeCAD.Console.PrintMessage("\n--------end problems---------\n")
         else:
             # remove highlighted nodes, if any
-            if FreeCAD.GuiUp:
+            if _gui_up():
                 self.mesh.ViewObject.HighlightedNodes = []
 
             FreeCAD.Console.PrintMessage("OpenRadioss finished without error.\n")
@@ -695,15 +1178,19 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
             error_app = f"{text}{message}"
             error_gui = f"{text}\n{message}"
             FreeCAD.Console.PrintError(error_app)
-            if FreeCAD.GuiUp:
+            if _gui_up():
                 QtGui.QMessageBox.critical(None, "Missing prerequisite", error_gui)
             return False
         else:
+            # write_k_file reads the document objects and setup_OR may show a message box,
+            # both run on this thread one after the other.
+            # OR_run calls setup_OR again, which then finds the binary in the cache.
             self.write_k_file()
+            self.setup_OR()
             if self.inp_file_name == "":
                 error_message = "Error on writing OpenRadioss k file.\n"
                 FreeCAD.Console.PrintError(error_message)
-                if FreeCAD.GuiUp:
+                if _gui_up():
                     QtGui.QMessageBox.critical(None, "Error", error_message)
                 return False
             else:
@@ -714,13 +1201,13 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
                         self.OR_binary_present
                     )
                     FreeCAD.Console.PrintError(error_message)
-                    if FreeCAD.GuiUp:
+                    if _gui_up():
                         QtGui.QMessageBox.critical(None, "Error", error_message)
                     return False
                 if ret_code != 0:
                     error_message = f"OpenRadioss finished with error {ret_code}.\n"
                     FreeCAD.Console.PrintError(error_message)
-                    if FreeCAD.GuiUp:
+                    if _gui_up():
                         QtGui.QMessageBox.critical(None, "Error", error_message)
                     return False
                 else:
@@ -739,114 +1226,108 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
                         FreeCAD.Console.PrintMessage("No results loaded or ParaView launch disabled.\n")
         return True
     
+    def _scan_stdout(self):
+        """Return the _StdoutScan of OR_stdout
+
+        start_OR scans the output while OpenRadioss runs, an OR_stdout set otherwise is scanned once here.
+        """
+        if self._scanned_stdout is not self.OR_stdout:
+            scan = _StdoutScan()
+            scan.feed(self.OR_stdout.encode())
+            scan.close()
+            self._stdout_scan = scan
+            self._scanned_stdout = self.OR_stdout
+        return self._stdout_scan
+
+    def _classify_errors(self):
+        """Return whether OR_stdout reports (elements without material, nonpositive jacobians)"""
+        scan = self._scan_stdout()
+        return scan.no_material, scan.nonpositive_jacobian
+
     def has_no_material_assigned(self):
         FreeCAD = _import_freecad()
 
-        if " *ERROR in calinput: no material was assigned" in self.OR_stdout:
-            without_material_elements = []
-            without_material_elemnodes = []
-            for line in self.OR_stdout.splitlines():
-                if "to element" in line:
-                    # print(line)
-                    # print(line.split())
-                    non_mat_ele = int(line.split()[2])
-                    # print(non_mat_ele)
-                    if non_mat_ele not in without_material_elements:
-                        without_material_elements.append(non_mat_ele)
-            for e in without_material_elements:
-                for n in self.mesh.FemMesh.getElementNodes(e):
-                    without_material_elemnodes.append(n)
-            without_material_elements = sorted(without_material_elements)
-            without_material_elemnodes = sorted(without_material_elemnodes)
-            command_for_withoutmatnodes = "without_material_elemnodes = {}".format(
-                without_material_elemnodes
+        scan = self._scan_stdout()
+        if scan.no_material:
+            get_nodes = self.mesh.FemMesh.getElementNodes
+            without_material_elemnodes = set(
+                chain.from_iterable(map(get_nodes, scan.no_material_elements))
             )
+            without_material_elements = sorted(scan.no_material_elements)
+            without_material_elemnodes = sorted(without_material_elemnodes)
+            # the node list is formatted once, for the console and the Gui command
+            command_for_withoutmatnodes = f"without_material_elemnodes = {without_material_elemnodes}"
             command_to_highlight = (
-                "Gui.ActiveDocument.{}.HighlightedNodes = without_material_elemnodes".format(
-                    self.mesh.Name
-                )
+                f"Gui.ActiveDocument.{self.mesh.Name}.HighlightedNodes = without_material_elemnodes"
             )
             # some output for the user
             FreeCAD.Console.PrintError(
                 "\n\nOpenRadioss returned an error due to elements without materials.\n"
             )
-            FreeCAD.Console.PrintMessage(
-                f"without_material_elements = {without_material_elements}\n"
-            )
-            FreeCAD.Console.PrintMessage(command_for_withoutmatnodes + "\n")
-            if FreeCAD.GuiUp:
+            log = _Log()
+            log.msg(f"without_material_elements = {without_material_elements}\n")
+            log.msg(command_for_withoutmatnodes + "\n")
+            if _gui_up():
                 import FreeCADGui
 
                 # with this the list without_material_elemnodes
                 # will be available for further user interaction
                 FreeCADGui.doCommand(command_for_withoutmatnodes)
-                FreeCAD.Console.PrintMessage("\n")
+                log.msg("\n")
                 FreeCADGui.doCommand(command_to_highlight)
-            FreeCAD.Console.PrintMessage(
+            log.msg(
                 "\nFollowing some commands to copy. "
                 "They will highlight the elements without materials "
                 "or to reset the highlighted nodes:\n"
             )
-            FreeCAD.Console.PrintMessage(command_to_highlight + "\n")
+            log.msg(command_to_highlight + "\n")
             # command to reset the Highlighted Nodes
-            FreeCAD.Console.PrintMessage(
-                f"Gui.ActiveDocument.{self.mesh.Name}.HighlightedNodes = []\n\n"
-            )
+            log.msg(f"Gui.ActiveDocument.{self.mesh.Name}.HighlightedNodes = []\n\n")
+            log.flush()
             return True
         else:
             return False
 
     def has_nonpositive_jacobians(self):
-        if "*ERROR in e_c3d: nonpositive jacobian" in self.OR_stdout:
-            nonpositive_jacobian_elements = []
-            nonpositive_jacobian_elenodes = []
-            for line in self.OR_stdout.splitlines():
-                if "determinant in element" in line:
-                    # print(line)
-                    # print(line.split())
-                    non_posjac_ele = int(line.split()[3])
-                    # print(non_posjac_ele)
-                    if non_posjac_ele not in nonpositive_jacobian_elements:
-                        nonpositive_jacobian_elements.append(non_posjac_ele)
-            for e in nonpositive_jacobian_elements:
-                for n in self.mesh.FemMesh.getElementNodes(e):
-                    nonpositive_jacobian_elenodes.append(n)
-            nonpositive_jacobian_elements = sorted(nonpositive_jacobian_elements)
-            nonpositive_jacobian_elenodes = sorted(nonpositive_jacobian_elenodes)
-            command_for_nonposjacnodes = "nonpositive_jacobian_elenodes = {}".format(
-                nonpositive_jacobian_elenodes
+        FreeCAD = _import_freecad()
+
+        scan = self._scan_stdout()
+        if scan.nonpositive_jacobian:
+            get_nodes = self.mesh.FemMesh.getElementNodes
+            nonpositive_jacobian_elenodes = set(
+                chain.from_iterable(map(get_nodes, scan.nonpositive_jacobian_elements))
             )
+            nonpositive_jacobian_elements = sorted(scan.nonpositive_jacobian_elements)
+            nonpositive_jacobian_elenodes = sorted(nonpositive_jacobian_elenodes)
+            # the node list is formatted once, for the console and the Gui command
+            command_for_nonposjacnodes = f"nonpositive_jacobian_elenodes = {nonpositive_jacobian_elenodes}"
             command_to_highlight = (
-                "Gui.ActiveDocument.{}.HighlightedNodes = nonpositive_jacobian_elenodes".format(
-                    self.mesh.Name
-                )
+                f"Gui.ActiveDocument.{self.mesh.Name}.HighlightedNodes = nonpositive_jacobian_elenodes"
             )
             # some output for the user
             FreeCAD.Console.PrintError(
                 "\n\nOpenRadioss returned an error due to nonpositive jacobian elements.\n"
             )
-            FreeCAD.Console.PrintMessage(
-                f"nonpositive_jacobian_elements = {nonpositive_jacobian_elements}\n"
-            )
-            FreeCAD.Console.PrintMessage(command_for_nonposjacnodes + "\n")
-            if FreeCAD.GuiUp:
+            log = _Log()
+            log.msg(f"nonpositive_jacobian_elements = {nonpositive_jacobian_elements}\n")
+            log.msg(command_for_nonposjacnodes + "\n")
+            if _gui_up():
                 import FreeCADGui
 
                 # with this the list nonpositive_jacobian_elenodes
                 # will be available for further user interaction
                 FreeCADGui.doCommand(command_for_nonposjacnodes)
-                FreeCAD.Console.PrintMessage("\n")
+                log.msg("\n")
                 FreeCADGui.doCommand(command_to_highlight)
-            FreeCAD.Console.PrintMessage(
+            log.msg(
                 "\nFollowing some commands to copy. "
                 "They highlight the nonpositive jacobians "
                 "or to reset the highlighted nodes:\n"
             )
-            FreeCAD.Console.PrintMessage(command_to_highlight + "\n")
+            log.msg(command_to_highlight + "\n")
             # command to reset the Highlighted Nodes
-            FreeCAD.Console.PrintMessage(
-                f"Gui.ActiveDocument.{self.mesh.Name}.HighlightedNodes = []\n\n"
-            )
+            log.msg(f"Gui.ActiveDocument.{self.mesh.Name}.HighlightedNodes = []\n\n")
+            log.flush()
             return True
         else:
             return False
@@ -865,26 +1346,18 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
         """Load results of OpenRadioss calculations from .frd file."""
         FreeCAD = _import_freecad()
 
-        import feminout.importCcxFrdResults as importCcxFrdResults
+        importCcxFrdResults = _import_result_reader("importCcxFrdResults")
 
-        frd_result_file = os.path.splitext(self.inp_file_name)[0] + ".frd"
+        frd_result_file = self.result_base + ".frd"
         if os.path.isfile(frd_result_file):
             importCcxFrdResults.importFrd(
                 frd_result_file, self.analysis, "OR_", self.solver.AnalysisType
             )
-            for m in self.analysis.Group:
-                if m.isDerivedFrom("Fem::FemResultObject"):
-                    self.results_present = True
-                    break
-            else:
-                if self.solver.AnalysisType == "check":
-                    for m in self.analysis.Group:
-                        if m.isDerivedFrom("Fem::FemMeshObjectPython"):
-                            # we have no result object but a mesh object
-                            # this happens in NOANALYSIS mode
-                            break
-                else:
-                    FreeCAD.Console.PrintError("FEM: No result object in active Analysis.\n")
+            if any(m.isDerivedFrom("Fem::FemResultObject") for m in self.analysis.Group):
+                self.results_present = True
+            elif self.solver.AnalysisType != "check":
+                # a check has no result object but only a mesh object, NOANALYSIS mode
+                FreeCAD.Console.PrintError("FEM: No result object in active Analysis.\n")
         else:
             FreeCAD.Console.PrintError(f"FEM: No frd result file found at {frd_result_file}\n")
 
@@ -892,18 +1365,17 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
         """Load results of OpenRadioss calculations from .dat file."""
         FreeCAD = _import_freecad()
 
-        import feminout.importORDatResults as importORDatResults
+        importORDatResults = _import_result_reader("importORDatResults")
 
-        dat_result_file = os.path.splitext(self.inp_file_name)[0] + ".dat"
+        dat_result_file = self.result_base + ".dat"
         mode_frequencies = None
         dat_content = None
 
         if os.path.isfile(dat_result_file):
             mode_frequencies = importORDatResults.import_dat(dat_result_file, self.analysis)
 
-            dat_file = open(dat_result_file)
-            dat_content = dat_file.read()
-            dat_file.close()
+            with open(dat_result_file, errors="replace") as dat_file:
+                dat_content = dat_file.read()
         else:
             FreeCAD.Console.PrintError(f"FEM: No dat result file found at {dat_result_file}\n")
 
@@ -920,7 +1392,7 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
             dat_text_obj = self.analysis.Document.addObject("App::TextDocument", "OR_dat_file")
             dat_text_obj.Text = dat_content
             dat_text_obj.setPropertyStatus("Text", "ReadOnly")  # set property editor readonly
-            if FreeCAD.GuiUp:
+            if _gui_up():
                 dat_text_obj.ViewObject.ReadOnly = True  # set editor view readonly
             self.analysis.addObject(dat_text_obj)
 
@@ -929,44 +1401,18 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
         FreeCAD = _import_freecad()
 
         try:
-            # Check if ParaView is available in the system PATH
-            import subprocess
-            import shutil
-
-            # Look for ParaView executable
-            paraview_exe = None
-
-            # Try common ParaView executable names and locations
-            possible_executables = [
-                "paraview",
-                "ParaView",
-                "/usr/bin/paraview",
-                "/usr/local/bin/paraview",
-                "/opt/paraview/bin/paraview",
-                "/Applications/ParaView.app/Contents/bin/paraview",  # macOS
-                "C:\\Program Files\\ParaView\\bin\\paraview.exe",  # Windows
-                "C:\\Program Files (x86)\\ParaView\\bin\\paraview.exe",  # Windows 32-bit
-            ]
-
-            for exe in possible_executables:
-                if shutil.which(exe) or (exe.endswith('.exe') and os.path.exists(exe)):
-                    paraview_exe = exe
-                    break
+            # Look for ParaView executable, searched once per session
+            paraview_exe = _find_paraview()
 
             if not paraview_exe:
                 FreeCAD.Console.PrintWarning("ParaView executable not found in system PATH. Please install ParaView or add it to your PATH.\n")
                 return False
 
             # Check if we have result files to visualize
-            result_files = []
-            base_name = os.path.splitext(self.inp_file_name)[0]
+            base_name = self.result_base
 
             # Look for common OpenRadioss result files
-            result_extensions = ['.frd', '.dat', '.h3d', '.t01', '.t02', '.t03', '.t04']
-            for ext in result_extensions:
-                result_file = base_name + ext
-                if os.path.exists(result_file):
-                    result_files.append(result_file)
+            result_files = _result_files(base_name)
 
             if not result_files:
                 FreeCAD.Console.PrintWarning("No OpenRadioss result files found for ParaView visualization.\n")
@@ -979,7 +1425,7 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
             cmd = [paraview_exe] + result_files
 
             # Launch ParaView in background
-            subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            _spawn_detached(cmd)
 
             FreeCAD.Console.PrintMessage(f"ParaView launched with files: {', '.join(result_files)}\n")
             return True
@@ -990,8 +1436,14 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
 
     def should_launch_paraview(self):
         """Check if ParaView should be launched based on user preferences."""
-        FreeCAD = _import_freecad()
-
+        # the preferences are read once per solver
+        if self._launch_paraview_of is None or self._launch_paraview_of is not self.solver:
+            self._launch_paraview = self._read_launch_paraview()
+            self._launch_paraview_of = self.solver
+        return self._launch_paraview
+
+    def _read_launch_paraview(self):
+        """Return the LaunchParaView setting of the solver, else of the preferences"""
         try:
             # Check user preferences for ParaView integration using settings module
             from femsolver.settings import get_launch_paraview
@@ -1011,9 +1463,13 @@ class FemToolsOR(QtCore.QRunnable, QtCore.QObject):
         """Generate bash command for manual ParaView launch."""
         FreeCAD = _import_freecad()
 
+        # Without GUI the command is only printed in debug mode, nobody reads it otherwise
+        if not (_gui_up() or _debug()):
+            return
+
         try:
             # Generate bash command for users to copy and paste
-            base_name = os.path.splitext(self.inp_file_name)[0]
+            base_name = self.result_base
             working_dir = os.path.dirname(self.inp_file_name)
 
             # Build command to find and launch ParaView
@@ -1042,16 +1498,18 @@ else
 fi
 '''
 
-            FreeCAD.Console.PrintMessage("\n" + "="*60 + "\n")
-            FreeCAD.Console.PrintMessage("📋 COPY AND PASTE THIS BASH COMMAND:\n")
-            FreeCAD.Console.PrintMessage("="*60 + "\n")
-            FreeCAD.Console.PrintMessage(command)
-            FreeCAD.Console.PrintMessage("="*60 + "\n")
-            FreeCAD.Console.PrintMessage("💡 Instructions:\n")
-            FreeCAD.Console.PrintMessage("   1. Copy the command above\n")
-            FreeCAD.Console.PrintMessage("   2. Paste it in a terminal\n")
-            FreeCAD.Console.PrintMessage("   3. Run it to launch ParaView with results\n")
-            FreeCAD.Console.PrintMessage("="*60 + "\n")
+            FreeCAD.Console.PrintMessage(
+                "\n" + _RULE
+                + "📋 COPY AND PASTE THIS BASH COMMAND:\n"
+                + _RULE
+                + command
+                + _RULE
+                + "💡 Instructions:\n"
+                "   1. Copy the command above\n"
+                "   2. Paste it in a terminal\n"
+                "   3. Run it to launch ParaView with results\n"
+                + _RULE
+            )
 
         except Exception as e:
             FreeCAD.Console.PrintError(f"Error generating ParaView command: {str(e)}\n")
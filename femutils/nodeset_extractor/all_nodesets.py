@@ -0,0 +1,73 @@
+"""
+Extract the nodesets of all constraint types with a single pass over the analysis.
+
+Generated by generate_nodeset_functions.py, do not edit.
+"""
+
+import importlib
+from types import SimpleNamespace
+
+CONSTRAINT_MODULES = {
+    'Fem::ConstraintBodyHeatSource': 'write_constraint_bodyheatsource',
+    'Fem::ConstraintCentrif': 'write_constraint_centrif',
+    'Fem::ConstraintContact': 'write_constraint_contact',
+    'Fem::ConstraintDisplacement': 'write_constraint_displacement',
+    'Fem::ConstraintFixed': 'write_constraint_fixed',
+    'Fem::ConstraintFluidBoundary': 'write_constraint_fluidsection',
+    'Fem::ConstraintForce': 'write_constraint_force',
+    'Fem::ConstraintHeatflux': 'write_constraint_heatflux',
+    'Fem::ConstraintInitialTemperature': 'write_constraint_initialtemperature',
+    'Fem::ConstraintPlaneRotation': 'write_constraint_planerotation',
+    'Fem::ConstraintPressure': 'write_constraint_pressure',
+    'Fem::ConstraintRadioss': 'write_constraint_radioss',
+    'Fem::ConstraintRigidBody': 'write_constraint_rigidbody',
+    'Fem::ConstraintRigidBodyStep': 'write_constraint_rigidbody_step',
+    'Fem::ConstraintSectionPrint': 'write_constraint_sectionprint',
+    'Fem::ConstraintSelfWeight': 'write_constraint_selfweight',
+    'Fem::ConstraintTemperature': 'write_constraint_temperature',
+    'Fem::ConstraintTie': 'write_constraint_tie',
+    'Fem::ConstraintTransform': 'write_constraint_transform',
+}
+
+CONSTRAINT_TYPES = frozenset(CONSTRAINT_MODULES)
+
+
+def _import_extractor(type_id):
+    """Return the extract_nodesets function of the module of type_id, None if it has none."""
+    module = importlib.import_module("." + CONSTRAINT_MODULES[type_id], __package__)
+    return getattr(module, 'extract_nodesets', None)
+
+
+def extract_all_nodesets(analysis, mesh_obj, extractors=None, progress_callback=None):
+    """Extract the nodesets of all constraints in the analysis.
+    
+    Args:
+        analysis: The FreeCAD FEM analysis object
+        mesh_obj: The FEM mesh object
+        extractors: Optional mapping of each constraint type to its extractor or None,
+            the extractor modules are imported here if not given
+        progress_callback: Optional function called with the number of constraint types done,
+            their total and the type just done, the extraction stops if it returns False
+        
+    Returns:
+        dict: Dictionary with nodeset name as key and node IDs as value,
+            None if progress_callback stopped the extraction
+    """
+    # Bucket the constraints by TypeId once
+    buckets = {}
+    wanted = CONSTRAINT_TYPES
+    for obj in analysis.Group:
+        type_id = getattr(obj, 'TypeId', None)
+        if type_id in wanted:
+            buckets.setdefault(type_id, []).append(obj)
+    
+    nodesets = {}
+    for done, (type_id, constraints) in enumerate(buckets.items(), 1):
+        extractor = extractors[type_id] if extractors is not None else _import_extractor(type_id)
+        if extractor is not None:
+            # the extractors only look at analysis.Group, hand them their bucket
+            nodesets.update(extractor(SimpleNamespace(Group=constraints), mesh_obj) or {})
+        if progress_callback is not None and progress_callback(done, len(buckets), type_id) is False:
+            return None
+    
+    return nodesets
@@ -25,11 +25,14 @@ def process_analysis(analysis, create_text_object=True, progress_callback=None):
         progress_callback(0, 1, "Starting nodeset extraction...")
     
     # Get the mesh object from analysis
-    mesh_obj = None
-    for obj in analysis.Group:
-        if hasattr(obj, 'Proxy') and hasattr(obj.Proxy, 'Type') and obj.Proxy.Type == 'Fem::FemMeshObject':
-            mesh_obj = obj
-            break
+    mesh_obj = next(
+        (
+            obj for obj in analysis.Group
+            if getattr(obj, 'TypeId', '') == 'Fem::FemMeshObjectPython'
+            or getattr(getattr(obj, 'Proxy', None), 'Type', '') == 'Fem::FemMeshObject'
+        ),
+        None,
+    )
     
     if not mesh_obj:
         return "No FEM mesh found in the analysis."
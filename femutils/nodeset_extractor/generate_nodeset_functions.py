@@ -17,36 +17,98 @@ template = """def extract_nodesets(analysis, mesh_obj):
     Returns:
         dict: Dictionary with nodeset name as key and node IDs as value
     \"\"\"
-    nodesets = {{}}
+    # node IDs of each nodeset, joined into a string once at the end
+    nodesets = defaultdict(set)
     
     # Find all {constraint_name} constraints in the analysis
-    constraints = [obj for obj in analysis.Group 
-                  if hasattr(obj, 'TypeId') and 
-                  obj.TypeId == '{constraint_type}']
+    constraints = [obj for obj in analysis.Group
+                  if getattr(obj, 'TypeId', None) == '{constraint_type}']
     
     for constraint in constraints:
         nodeset_name = "{prefix}_{{}}".format(constraint.Name)
         
         # Get nodes from the constraint references
         if hasattr(constraint, 'References') and constraint.References:
-            node_ids = []
+            node_ids = nodesets[nodeset_name]
             for (obj, elem) in constraint.References:
                 if hasattr(obj, 'getNodeByEdge'):
                     # Get nodes from edges/faces/vertices
-                    for e in elem:
-                        if 'Edge' in e:
-                            node_ids.extend(obj.getNodeByEdge(e))
-                        elif 'Face' in e:
-                            node_ids.extend(obj.getNodeByFace(e))
-                        elif 'Vertex' in e:
-                            node_ids.append(obj.getNodeByVertex(e))
-            
-            if node_ids:
-                nodesets[nodeset_name] = ",".join(map(str, sorted(set(node_ids))))
+                    add_element_nodes(obj, elem, node_ids)
+    
+    return {{
+        name: ",".join(map(str, sorted(node_ids)))
+        for name, node_ids in nodesets.items()
+        if node_ids
+    }}
+"""
+
+# Module imports the extract_nodesets function needs, see add_import
+template_imports = [
+    "from collections import defaultdict",
+    "from .nodeset_utils import add_element_nodes",
+]
+
+# Template for the module dispatching to all extract_nodesets functions
+dispatch_template = """\"\"\"
+Extract the nodesets of all constraint types with a single pass over the analysis.
+
+Generated by generate_nodeset_functions.py, do not edit.
+\"\"\"
+
+import importlib
+from types import SimpleNamespace
+
+CONSTRAINT_MODULES = {{
+{modules}
+}}
+
+CONSTRAINT_TYPES = frozenset(CONSTRAINT_MODULES)
+
+
+def _import_extractor(type_id):
+    \"\"\"Return the extract_nodesets function of the module of type_id, None if it has none.\"\"\"
+    module = importlib.import_module("." + CONSTRAINT_MODULES[type_id], __package__)
+    return getattr(module, 'extract_nodesets', None)
+
+
+def extract_all_nodesets(analysis, mesh_obj, extractors=None, progress_callback=None):
+    \"\"\"Extract the nodesets of all constraints in the analysis.
+    
+    Args:
+        analysis: The FreeCAD FEM analysis object
+        mesh_obj: The FEM mesh object
+        extractors: Optional mapping of each constraint type to its extractor or None,
+            the extractor modules are imported here if not given
+        progress_callback: Optional function called with the number of constraint types done,
+            their total and the type just done, the extraction stops if it returns False
+        
+    Returns:
+        dict: Dictionary with nodeset name as key and node IDs as value,
+            None if progress_callback stopped the extraction
+    \"\"\"
+    # Bucket the constraints by TypeId once
+    buckets = {{}}
+    wanted = CONSTRAINT_TYPES
+    for obj in analysis.Group:
+        type_id = getattr(obj, 'TypeId', None)
+        if type_id in wanted:
+            buckets.setdefault(type_id, []).append(obj)
+    
+    nodesets = {{}}
+    for done, (type_id, constraints) in enumerate(buckets.items(), 1):
+        extractor = extractors[type_id] if extractors is not None else _import_extractor(type_id)
+        if extractor is not None:
+            # the extractors only look at analysis.Group, hand them their bucket
+            nodesets.update(extractor(SimpleNamespace(Group=constraints), mesh_obj) or {{}})
+        if progress_callback is not None and progress_callback(done, len(buckets), type_id) is False:
+            return None
     
     return nodesets
 """
 
+# Name of the generated dispatch module
+dispatch_file_name = 'all_nodesets.py'
+
 # Mapping of constraint types to their prefixes and full type names
 constraint_types = {
     'write_constraint_bodyheatsource.py': {
@@ -127,6 +189,30 @@ constraint_types = {
     }
 }
 
+def add_import(content, import_line):
+    """Return content with import_line added to its module imports, unless it is there already.
+    
+    Relative imports go after the last module import, the others before the first one.
+    A module without imports gets import_line after its __url__.
+    """
+    if re.search('^' + re.escape(import_line) + '$', content, re.M):
+        return content
+    # the module imports are above the first function
+    head = content[:content.find('\ndef ')]
+    imports = list(re.finditer(r'^(?:import|from) .*$', head, re.M))
+    if not imports:
+        url = re.search(r'^__url__ = .*$', head, re.M)
+        if url is None:
+            return import_line + '\n' + content
+        return content[:url.end()] + '\n\n' + import_line + content[url.end():]
+    if import_line.startswith('from .'):
+        last = imports[-1]
+        # one empty line between the absolute and the relative imports
+        separator = '\n' if last.group().startswith('from .') else '\n\n'
+        return content[:last.end()] + separator + import_line + content[last.end():]
+    first = imports[0]
+    return content[:first.start()] + import_line + '\n\n' + content[first.start():]
+
 def update_constraint_file(file_path, constraint_info):
     """Update a constraint file with the extract_nodesets function."""
     with open(file_path, 'r') as f:
@@ -153,8 +239,10 @@ def update_constraint_file(file_path, constraint_info):
         prefix=constraint_info['prefix']
     )
     
-    # Insert the function
+    # Insert the function and its imports
     new_content = content[:insert_pos] + '\n\n' + func + content[insert_pos:]
+    for import_line in template_imports:
+        new_content = add_import(new_content, import_line)
     
     # Write the updated content back to the file
     with open(file_path, 'w') as f:
@@ -162,6 +250,17 @@ def update_constraint_file(file_path, constraint_info):
     
     print(f"Updated {file_path}")
 
+def write_dispatch_file(file_path):
+    """Write the module bucketing the constraints for all extract_nodesets functions."""
+    modules = "\n".join(
+        "    '{}': '{}',".format(info['type'], os.path.splitext(filename)[0])
+        for filename, info in constraint_types.items()
+    )
+    with open(file_path, 'w') as f:
+        f.write(dispatch_template.format(modules=modules))
+    
+    print(f"Updated {file_path}")
+
 def main():
     """Main function to update all constraint files."""
     dir_path = os.path.dirname(os.path.abspath(__file__))
@@ -172,6 +271,8 @@ def main():
             update_constraint_file(file_path, constraint_info)
         else:
             print(f"Warning: File not found: {file_path}")
+    
+    write_dispatch_file(os.path.join(dir_path, dispatch_file_name))
 
 if __name__ == "__main__":
     main()
@@ -13,6 +13,11 @@ import FreeCADGui as Gui
 from PySide6 import QtCore, QtGui, QtWidgets
 from femutils.nodeset_extractor.writer import extract_nodesets
 
+# Minimum time between two processEvents calls, about 30 per second
+_PUMP_INTERVAL_MS = 33
+# Time the log messages are collected before they are added to the results together
+_LOG_FLUSH_MS = 100
+
 
 class ProgressDialog(QtWidgets.QProgressDialog):
     """Progress dialog for the nodeset extraction process"""
@@ -28,11 +33,11 @@ class ProgressDialog(QtWidgets.QProgressDialog):
         
     def update_progress(self, current, total, message):
         """Update the progress dialog"""
+        self.setLabelText(message)
+        # setValue of a modal dialog already processes the events, that repaints it and reads Cancel
         if total > 0:
             progress = int((current / total) * 100)
             self.setValue(min(progress, 100))
-        self.setLabelText(message)
-        QtWidgets.QApplication.processEvents()
         
         # Check if user clicked cancel
         return not self.wasCanceled()
@@ -45,6 +50,17 @@ class NodesetExtractorTaskPanel:
         self.form = QtWidgets.QWidget()
         self.form.setWindowTitle("Nodeset Extractor")
         self.progress_dialog = None
+        # the nodesets of the last extraction, exported as they are
+        self._last_result = None
+        # time since the event loop was last pumped by log_message
+        self._last_pump = QtCore.QElapsedTimer()
+        self._last_pump.start()
+        # log messages not shown yet, see _flush_log
+        self._log_buf = []
+        self._log_timer = QtCore.QTimer()
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(_LOG_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_log)
         self.setup_ui()
         
     def setup_ui(self):
@@ -105,18 +121,36 @@ class NodesetExtractorTaskPanel:
         self.last_export_dir = None
     
     def log_message(self, message):
-        """Add a message to the log"""
+        """Add a message to the log, shown with the other messages of the next _LOG_FLUSH_MS"""
         timestamp = time.strftime("%H:%M:%S", time.localtime())
-        self.result_text.append(f"[{timestamp}] {message}")
+        self._log_buf.append(f"[{timestamp}] {message}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+        if self._last_pump.elapsed() > _PUMP_INTERVAL_MS:
+            self._flush_log()
+            QtWidgets.QApplication.processEvents()
+            self._last_pump.restart()
+    
+    def _flush_log(self):
+        """Add the collected log messages to the results with a single insertion"""
+        if not self._log_buf:
+            return
+        text = "\n".join(self._log_buf)
+        self._log_buf.clear()
+        document = self.result_text.document()
+        if not document.isEmpty():
+            text = "\n" + text
+        cursor = QtGui.QTextCursor(document)
+        cursor.movePosition(QtGui.QTextCursor.End)
+        cursor.insertText(text)
         self.result_text.verticalScrollBar().setValue(
             self.result_text.verticalScrollBar().maximum())
-        QtWidgets.QApplication.processEvents()
     
-    def progress_callback(self, current, total, message):
-        """Handle progress updates"""
-        if self.progress_dialog:
-            return self.progress_dialog.update_progress(current, total, message)
-        return True
+    def _clear_results(self):
+        """Clear the results and the log messages not shown yet"""
+        self._log_buf.clear()
+        self._last_result = None
+        self.result_text.clear()
     
     def extract_nodesets(self):
         """Extract nodesets from the active analysis"""
@@ -124,7 +158,7 @@ class NodesetExtractorTaskPanel:
             import FemGui
             
             # Reset UI state
-            self.result_text.clear()
+            self._clear_results()
             self.export_btn.setEnabled(False)
             self.log_message("Starting nodeset extraction...")
             
@@ -175,39 +209,61 @@ class NodesetExtractorTaskPanel:
                 if not mesh_obj:
                     raise ValueError("No FEM mesh found in the analysis. Check if the analysis contains a mesh object.")
                 
-                # Extract nodesets
+                # Extract nodesets on the GUI thread, the extractors read the live document
+                # objects and the modal progress dialog keeps them from being edited meanwhile
+                self.extract_btn.setEnabled(False)
                 result = extract_nodesets(
                     analysis,
                     mesh_obj,
                     create_text_object=self.create_text_cb.isChecked(),
                     progress_callback=self.progress_callback
                 )
-                
-                # Display results
-                self.result_text.clear()
-                self.result_text.append(result)
-                self.log_message("Nodesets extracted successfully")
-                self.export_btn.setEnabled(True)
+                self._on_extracted(result)
                 
             except Exception as e:
-                error_msg = f"Error extracting nodesets: {str(e)}"
-                self.log_message(error_msg)
-                App.Console.PrintError(f"{error_msg}\n")
-                
-            finally:
-                self.progress_dialog.reset()
-                self.progress_dialog = None
+                self._on_extract_failed(str(e))
                 
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)}"
             self.log_message(error_msg)
             App.Console.PrintError(f"{error_msg}\n")
     
+    def progress_callback(self, current, total, message):
+        """Handle progress updates"""
+        if self.progress_dialog:
+            return self.progress_dialog.update_progress(current, total, message)
+        return True
+    
+    def _on_extracted(self, result):
+        """Display the extracted nodesets"""
+        self._clear_results()
+        self._last_result = result
+        self.result_text.append(result)
+        self.log_message("Nodesets extracted successfully")
+        self.export_btn.setEnabled(True)
+        self._end_extraction()
+    
+    def _on_extract_failed(self, message):
+        """Report an error of the extraction"""
+        error_msg = f"Error extracting nodesets: {message}"
+        self.log_message(error_msg)
+        App.Console.PrintError(f"{error_msg}\n")
+        self._end_extraction()
+    
+    def _end_extraction(self):
+        """Close the progress dialog and allow the next extraction"""
+        if self.progress_dialog:
+            self.progress_dialog.reset()
+            self.progress_dialog = None
+        self.extract_btn.setEnabled(True)
+    
     def export_nodesets(self):
         """Export the nodeset data to a file"""
         try:
-            # Get the text to export
-            text = self.result_text.toPlainText()
+            # Get the text to export, the results view also holds the log messages
+            text = self._last_result
+            if text is None:
+                text = self.result_text.toPlainText()
             if not text.strip():
                 self.log_message("No nodeset data to export")
                 return
@@ -229,7 +285,7 @@ class NodesetExtractorTaskPanel:
                     file_path += '.txt'
                 
                 # Save the file
-                with open(file_path, 'w', encoding='utf-8') as f:
+                with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
                     f.write(text)
                 
                 # Update last export directory
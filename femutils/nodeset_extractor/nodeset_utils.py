@@ -4,12 +4,17 @@ Utility functions for nodeset extraction.
 
 import importlib
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 import sys
 import traceback
+from collections import OrderedDict
 from pathlib import Path
+import numpy as np
 import FreeCAD
 import Part
-from FreeCAD import Vector
+
+from .all_nodesets import CONSTRAINT_MODULES, extract_all_nodesets
 
 # Try to import QtCore for potential GUI operations
 try:
@@ -18,20 +23,22 @@ except ImportError:
     QtCore = None
     print("[NODESET] [INFO] PySide6.QtCore not available, running in console mode")
 
-# Dictionary mapping constraint types to their module names
-CONSTRAINT_MODULES = {
-    'Fem::ConstraintFixed': 'write_constraint_fixed',
-    'Fem::ConstraintForce': 'write_constraint_force',
-    'Fem::ConstraintPressure': 'write_constraint_pressure',
-    'Fem::ConstraintContact': 'write_constraint_contact',
-    'Fem::ConstraintTie': 'write_constraint_tie',
-    'Fem::ConstraintHeatflux': 'write_constraint_heatflux',
-    'Fem::ConstraintDisplacement': 'write_constraint_displacement',
-    'Fem::ConstraintTemperature': 'write_constraint_temperature',
-}
+# Try to import a kd-tree to find the mesh nodes near a geometry
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+    print("[NODESET] [INFO] scipy not available, mesh nodes are filtered without kd-tree")
+
+# The constraint types and their modules are those of the generated dispatch module
+
+# DEBUG messages are only logged if set, their text is not even built otherwise
+_DEBUG = False
 
 def log_message(level, message):
     #Log a message with the specified log level.
+    if level == 'DEBUG' and not _DEBUG:
+        return
     log_msg = f"[NODESET] [{level}] {message}"
     print(log_msg)
     
@@ -49,6 +56,105 @@ def log_message(level, message):
         pass
 
 
+# Node IDs, coordinates, kd-tree and vertices of each mesh object by _mesh_key, see _mesh_nodes
+_MESH_NODES = {}
+
+
+# Nodes found by _reference_nodes per (mesh, part, sub element, tolerance), least recently used first
+_REFERENCE_NODES = OrderedDict()
+_REFERENCE_NODES_SIZE = 4096
+
+
+def clear_mesh_cache():
+    """Forget the mesh nodes read by _mesh_nodes and the nodes found by _reference_nodes,
+    called when an extraction starts."""
+    _MESH_NODES.clear()
+    _REFERENCE_NODES.clear()
+
+
+def _mesh_key(mesh_obj):
+    """Return the key of mesh_obj in the mesh caches, its document and object name."""
+    return (mesh_obj.Document.Name, mesh_obj.Name)
+
+
+def _mesh_nodes(mesh_obj):
+    """Return the node IDs of mesh_obj, an N x 3 array of their coordinates, their kd-tree
+    and a dict for the Part.Vertex of each node ID, filled by _node_vertex.
+    
+    The kd-tree is None without scipy. The mesh is read once for all geometries
+    of an extraction, clear_mesh_cache makes the next extraction see a changed mesh.
+    """
+    key = _mesh_key(mesh_obj)
+    nodes = _MESH_NODES.get(key)
+    if nodes is None:
+        mesh_nodes = mesh_obj.FemMesh.Nodes
+        ids = np.fromiter(mesh_nodes.keys(), dtype=np.int64, count=len(mesh_nodes))
+        coords = np.array(
+            [(v.x, v.y, v.z) for v in mesh_nodes.values()], dtype=np.float64
+        ).reshape(-1, 3)
+        tree = cKDTree(coords, leafsize=32) if cKDTree is not None else None
+        nodes = _MESH_NODES[key] = (ids, coords, tree, {})
+    return nodes
+
+
+def _node_vertex(vertices, node_id, x, y, z):
+    """Return the Part.Vertex of a node at x, y, z, made once per mesh and node."""
+    vertex = vertices.get(node_id)
+    if vertex is None:
+        vertex = vertices[node_id] = Part.Vertex(x, y, z)
+    return vertex
+
+
+def _nodes_in_box(mesh_obj, bbox):
+    """Return the IDs and coordinates of the mesh nodes inside bbox."""
+    ids, coords, tree = _mesh_nodes(mesh_obj)[:3]
+    if tree is not None:
+        # only the nodes in the ball around the box can be inside it
+        center = bbox.Center
+        index = tree.query_ball_point((center.x, center.y, center.z), r=bbox.DiagonalLength / 2)
+        ids = ids[index]
+        coords = coords[index]
+    inside = np.all(
+        (coords >= (bbox.XMin, bbox.YMin, bbox.ZMin)) & (coords <= (bbox.XMax, bbox.YMax, bbox.ZMax)),
+        axis=1,
+    )
+    return ids[inside], coords[inside]
+
+
+def _thread_count():
+    """Return the number of threads checking node distances, 0 in the preferences means all cores."""
+    threads = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem").GetInt(
+        "NodesetExtractorThreads", 0
+    )
+    return threads if threads > 0 else (os.cpu_count() or 1)
+
+
+def _nodes_on_shape(geometry, mesh_obj, ids, coords, tolerance):
+    """Return the IDs of the nodes of mesh_obj within tolerance of geometry.
+    
+    The distances are computed by OCCT, in chunks spread over _thread_count threads.
+    """
+    vertices = _mesh_nodes(mesh_obj)[3]
+    nodes = [
+        (node_id, _node_vertex(vertices, node_id, x, y, z))
+        for node_id, (x, y, z) in zip(ids.tolist(), coords.tolist())
+    ]
+    chunks = [nodes[i:i + 256] for i in range(0, len(nodes), 256)]
+    
+    def near(chunk):
+        # one distance to a compound of all its vertices rejects a chunk away from the geometry
+        if len(chunk) > 1 and geometry.distToShape(Part.Compound([v for _, v in chunk]))[0] > tolerance:
+            return []
+        return [node_id for node_id, vertex in chunk if geometry.distToShape(vertex)[0] <= tolerance]
+    
+    threads = _thread_count()
+    # a pool is not worth it for a few nodes
+    if threads < 2 or len(nodes) < 64:
+        return list(chain.from_iterable(map(near, chunks)))
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(chain.from_iterable(executor.map(near, chunks)))
+
+
 def extract_nodes_from_geometry(geometry, mesh_obj, tolerance=1e-7, log_prefix=""):
     """Extract node IDs from geometry that are within tolerance of the mesh.
     
@@ -65,7 +171,6 @@ def extract_nodes_from_geometry(geometry, mesh_obj, tolerance=1e-7, log_prefix="
         log_message('ERROR', f"{log_prefix}Mesh object has no FemMesh attribute")
         return set()
         
-    fem_mesh = mesh_obj.FemMesh
     node_ids = set()
     
     # Create a bounding box check first for performance
@@ -73,36 +178,67 @@ def extract_nodes_from_geometry(geometry, mesh_obj, tolerance=1e-7, log_prefix="
     bbox.enlarge(tolerance)
     
     # Find all nodes within the bounding box
-    potential_nodes = []
-    for node_id, node in fem_mesh.Nodes.items():
-        if bbox.isInside(Vector(node)):
-            potential_nodes.append((node_id, Vector(node)))
+    potential_ids, potential_coords = _nodes_in_box(mesh_obj, bbox)
     
     # For vertices, edges, and faces, we need to check the exact distance
     if geometry.ShapeType == 'Vertex':
         # For vertices, just check distance to the point
         point = geometry.Point
-        for node_id, node_pos in potential_nodes:
-            if (node_pos - point).Length <= tolerance:
-                node_ids.add(node_id)
+        diff = potential_coords - (point.x, point.y, point.z)
+        close = np.einsum('ij,ij->i', diff, diff) <= tolerance * tolerance
+        node_ids.update(potential_ids[close].tolist())
         
-    elif geometry.ShapeType in ['Edge', 'Face']:
-        # For edges and faces, check distance to the geometry
-        for node_id, node_pos in potential_nodes:
-            dist = geometry.distToShape(Part.Vertex(node_pos))[0]
-            if dist <= tolerance:
-                node_ids.add(node_id)
-                
-    elif geometry.ShapeType in ['Solid', 'Compound', 'Shell']:
-        # For solids and compounds, check distance to the shape
-        for node_id, node_pos in potential_nodes:
-            dist = geometry.distToShape(Part.Vertex(node_pos))[0]
-            if dist <= tolerance:
-                node_ids.add(node_id)
+    elif geometry.ShapeType in ['Edge', 'Face', 'Solid', 'Compound', 'Shell']:
+        # For edges, faces, solids and compounds, check distance to the geometry
+        node_ids.update(_nodes_on_shape(geometry, mesh_obj, potential_ids, potential_coords, tolerance))
     
-    log_message('DEBUG', f"{log_prefix}Found {len(node_ids)} nodes on {geometry.ShapeType} within {tolerance} tolerance")
+    if _DEBUG:
+        log_message('DEBUG', f"{log_prefix}Found {len(node_ids)} nodes on {geometry.ShapeType} within {tolerance} tolerance")
     return node_ids
 
+def _reference_nodes(part_obj, elem, mesh_obj, tolerance=1e-7, log_prefix=""):
+    """Return the nodes of mesh_obj on the sub element elem of part_obj, on its whole shape if elem is None.
+    
+    Several constraints often reference the same face, its nodes are only searched once
+    per extraction.
+    """
+    key = (_mesh_key(mesh_obj), part_obj.Name, elem, tolerance)
+    nodes = _REFERENCE_NODES.get(key)
+    if nodes is not None:
+        _REFERENCE_NODES.move_to_end(key)
+        return nodes
+    
+    geometry = part_obj.Shape if elem is None else part_obj.Shape.getElement(elem)
+    nodes = frozenset(extract_nodes_from_geometry(geometry, mesh_obj, tolerance, log_prefix))
+    _REFERENCE_NODES[key] = nodes
+    if len(_REFERENCE_NODES) > _REFERENCE_NODES_SIZE:
+        _REFERENCE_NODES.popitem(last=False)
+    return nodes
+
+# Mesh method returning the nodes of a sub element, by the first letter of its name,
+# and whether it returns a list of nodes
+_NODE_GETTERS = {
+    'E': ('getNodeByEdge', True),
+    'F': ('getNodeByFace', True),
+    'V': ('getNodeByVertex', False),
+}
+
+def add_element_nodes(obj, elems, node_ids):
+    """Add the mesh nodes of the sub elements elems of obj to the set node_ids.
+    
+    obj provides getNodeByEdge, getNodeByFace and getNodeByVertex,
+    sub elements other than edges, faces and vertices are skipped.
+    """
+    for e in elems:
+        method, many = _NODE_GETTERS.get(e[:1], (None, False))
+        if method is None:
+            continue
+        nodes = getattr(obj, method)(e)
+        if many:
+            node_ids.update(nodes)
+        else:
+            node_ids.add(nodes)
+
 def extract_nodes_from_references(references, mesh_obj, log_prefix=""):
     #Extract node IDs from geometry references using the mesh object.
     
@@ -122,72 +258,64 @@ def extract_nodes_from_references(references, mesh_obj, log_prefix=""):
         log_message('ERROR', f"{log_prefix}Mesh object has no FemMesh attribute")
         return set()
         
-    fem_mesh = mesh_obj.FemMesh
     node_ids = set()
     
     for ref_idx, (part_obj, elem_list) in enumerate(references):
-        log_message('DEBUG', f"{log_prefix}Processing reference {ref_idx}: {part_obj.Name if hasattr(part_obj, 'Name') else part_obj}, elements: {elem_list}")
+        if _DEBUG:
+            log_message('DEBUG', f"{log_prefix}Processing reference {ref_idx}: {getattr(part_obj, 'Name', part_obj)}, elements: {elem_list}")
         
         if not hasattr(part_obj, 'Shape'):
             log_message('WARNING', f"{log_prefix}Reference object has no Shape attribute")
             continue
-            
-        # Get the part object that defines the constraint
-        part_shape = part_obj.Shape
         
         # If no specific elements are provided, use the whole shape
         if not elem_list:
-            log_message('DEBUG', f"{log_prefix}No elements specified, using entire shape")
-            element_nodes = extract_nodes_from_geometry(part_shape, mesh_obj, log_prefix=log_prefix)
+            if _DEBUG:
+                log_message('DEBUG', f"{log_prefix}No elements specified, using entire shape")
+            element_nodes = _reference_nodes(part_obj, None, mesh_obj, log_prefix=log_prefix)
             node_ids.update(element_nodes)
             continue
             
         # Process each element in the reference
         for elem in elem_list:
             try:
-                # Get the sub-element (face, edge, or vertex)
-                element = part_shape.getElement(elem)
-                
-                # Extract nodes from this element with proper tolerance checking
-                element_nodes = extract_nodes_from_geometry(element, mesh_obj, log_prefix=f"{log_prefix}[{elem}] ")
+                # Extract nodes from the sub-element (face, edge, or vertex) with proper tolerance checking
+                element_nodes = _reference_nodes(part_obj, elem, mesh_obj, log_prefix=f"{log_prefix}[{elem}] ")
                 node_ids.update(element_nodes)
                 
             except Exception as e:
                 log_message('ERROR', f"{log_prefix}Error processing element {elem}: {str(e)}")
-                log_message('DEBUG', f"{log_prefix}{traceback.format_exc()}")
+                if _DEBUG:
+                    log_message('DEBUG', f"{log_prefix}{traceback.format_exc()}")
                 
-                # Fallback to the old method if the new one fails
+                # Retry with the looser tolerance of the old node-by-node search
                 try:
-                    log_message('DEBUG', f"{log_prefix}Falling back to legacy node extraction for {elem}")
-                    element = part_shape.getElement(elem)
-                    element_nodes = set()
-                    
-                    # Bounding box check first for performance
-                    bbox = element.BoundBox
-                    bbox.enlarge(1e-6)  # Small tolerance for floating point inaccuracies
-                    
-                    for node_id, node in fem_mesh.Nodes.items():
-                        if bbox.isInside(Vector(node)):
-                            if element.distToShape(Part.Vertex(node))[0] < 1e-6:
-                                element_nodes.add(node_id)
-                    
+                    if _DEBUG:
+                        log_message('DEBUG', f"{log_prefix}Falling back to legacy node extraction for {elem}")
+                    element_nodes = _reference_nodes(
+                        part_obj, elem, mesh_obj, tolerance=1e-6, log_prefix=f"{log_prefix}[legacy {elem}] "
+                    )
                     node_ids.update(element_nodes)
-                    log_message('DEBUG', f"{log_prefix}Legacy method found {len(element_nodes)} nodes for {elem}")
+                    if _DEBUG:
+                        log_message('DEBUG', f"{log_prefix}Legacy method found {len(element_nodes)} nodes for {elem}")
                     
                 except Exception as e2:
                     log_message('ERROR', f"{log_prefix}Legacy method also failed for {elem}: {str(e2)}")
     
-    log_message('DEBUG', f"{log_prefix}Found {len(node_ids)} total nodes from references")
+    if _DEBUG:
+        log_message('DEBUG', f"{log_prefix}Found {len(node_ids)} total nodes from references")
     return node_ids
 
 def import_constraint_module(module_name):
     #Dynamically import a constraint module.
     try:
         full_module_name = f'femutils.nodeset_extractor.{module_name}'
-        log_message('DEBUG', f'Importing module: {full_module_name}')
+        if _DEBUG:
+            log_message('DEBUG', f'Importing module: {full_module_name}')
         module = importlib.import_module(full_module_name)
         if hasattr(module, 'extract_nodesets'):
-            log_message('DEBUG', f'Found extract_nodesets in {full_module_name}')
+            if _DEBUG:
+                log_message('DEBUG', f'Found extract_nodesets in {full_module_name}')
             return module.extract_nodesets
         else:
             log_message('WARNING', f'Module {full_module_name} has no extract_nodesets function')
@@ -195,18 +323,64 @@ def import_constraint_module(module_name):
         log_message('WARNING', f'Failed to import {module_name}: {str(e)}')
     except Exception as e:
         log_message('ERROR', f'Error importing {module_name}: {str(e)}')
-        log_message('DEBUG', traceback.format_exc())
+        if _DEBUG:
+            log_message('DEBUG', traceback.format_exc())
     return None
 
-# Pre-import all constraint modules
-CONSTRAINT_EXTRACTORS = {}
-for const_type, module_name in CONSTRAINT_MODULES.items():
-    extractor = import_constraint_module(module_name)
-    if extractor:
-        CONSTRAINT_EXTRACTORS[const_type] = extractor
-        log_message('INFO', f'Loaded extractor for {const_type} from {module_name}')
-    else:
-        log_message('WARNING', f'No extractor available for {const_type} ({module_name})')
+def _logged_extractor(const_type, extractor):
+    """Wrap extractor to log what it found, an error only loses the nodesets of const_type."""
+    def extract(analysis, mesh_obj):
+        if _DEBUG:
+            log_message('DEBUG', f'Extracting nodesets for {len(analysis.Group)} {const_type}')
+        try:
+            constraint_nodesets = extractor(analysis, mesh_obj)
+        except Exception as e:
+            log_message('ERROR', f'Error processing {const_type}: {str(e)}')
+            if _DEBUG:
+                log_message('DEBUG', traceback.format_exc())
+            return None
+        if constraint_nodesets and isinstance(constraint_nodesets, dict):
+            log_message('INFO', f'Extracted {len(constraint_nodesets)} nodesets from {const_type}')
+            return constraint_nodesets
+        if _DEBUG:
+            log_message('DEBUG', f'No nodesets extracted from {const_type}')
+        return None
+    return extract
+
+class _LazyExtractors(dict):
+    """Extractor of each constraint type, its module is only imported when the type is first looked up.
+    
+    Unknown types and modules without extractor map to None.
+    """
+    
+    def __missing__(self, const_type):
+        module_name = CONSTRAINT_MODULES.get(const_type)
+        if module_name is None:
+            return None
+        extractor = import_constraint_module(module_name)
+        if extractor:
+            log_message('INFO', f'Loaded extractor for {const_type} from {module_name}')
+            extractor = _logged_extractor(const_type, extractor)
+        elif _DEBUG:
+            # import_constraint_module already warned why
+            log_message('DEBUG', f'No extractor available for {const_type} ({module_name})')
+        self[const_type] = extractor
+        return extractor
+
+CONSTRAINT_EXTRACTORS = _LazyExtractors()
+
+def _node_lines(nodes, per_line):
+    """Return the lines listing the node IDs of a nodeset, per_line IDs each.
+    
+    nodes is the comma separated string returned by the extractors or an iterable of IDs.
+    """
+    ids = nodes.split(",") if isinstance(nodes, str) and nodes else list(map(str, nodes))
+    # zip over one iterator groups the IDs without slicing, the rest is one shorter line
+    lines = list(map(" ".join, zip(*[iter(ids)] * per_line)))
+    rest = len(ids) % per_line
+    if rest:
+        lines.append(" ".join(ids[-rest:]))
+    return lines
 
 def extract_nodesets(analysis, mesh_obj, create_text_object=False, progress_callback=None):
     #Extract nodesets from analysis and return as a string.
@@ -223,7 +397,7 @@ def extract_nodesets(analysis, mesh_obj, create_text_object=False, progress_call
     #Returns:
     #    str: The nodeset data as a formatted string, or empty string if no nodesets found
 
-    nodesets = {}
+    clear_mesh_cache()
     
     if not hasattr(analysis, 'Group') or not analysis.Group:
         log_message('WARNING', 'Analysis has no group or is empty')
@@ -231,36 +405,20 @@ def extract_nodesets(analysis, mesh_obj, create_text_object=False, progress_call
     
     log_message('INFO', f'Found {len(analysis.Group)} objects in analysis group')
     
-    # Process each constraint in the analysis
-    for i, obj in enumerate(analysis.Group):
-        if not hasattr(obj, 'TypeId'):
-            log_message('DEBUG', f'Object {i} has no TypeId, skipping: {obj}')
-            continue
-            
-        log_message('DEBUG', f'Processing object {i}: {obj.TypeId} - {obj.Name if hasattr(obj, 'Name') else 'Unnamed'}')
-        
-        # Use the appropriate extractor for this constraint type
-        extractor = CONSTRAINT_EXTRACTORS.get(obj.TypeId)
-        if extractor:
-            try:
-                log_message('DEBUG', f'Extracting nodesets for {obj.TypeId} - {obj.Name if hasattr(obj, 'Name') else 'Unnamed'}')
-                constraint_nodesets = extractor(analysis, mesh_obj)
-                if constraint_nodesets and isinstance(constraint_nodesets, dict):
-                    log_message('INFO', f'Extracted {len(constraint_nodesets)} nodesets from {obj.TypeId} - {obj.Name if hasattr(obj, 'Name') else 'Unnamed'}')
-                    nodesets.update(constraint_nodesets)
-                else:
-                    log_message('DEBUG', f'No nodesets extracted from {obj.TypeId} - {obj.Name if hasattr(obj, 'Name') else 'Unnamed'}')
-            except Exception as e:
-                log_message('ERROR', f'Error processing {obj.TypeId} - {obj.Name if hasattr(obj, 'Name') else 'Unnamed'}: {str(e)}')
-                log_message('DEBUG', traceback.format_exc())
-        else:
-            log_message('DEBUG', f'No extractor available for {obj.TypeId}')
-            
+    def report(done, total, type_id):
         # Update progress if callback is provided
         if progress_callback and hasattr(progress_callback, '__call__'):
-            if not progress_callback(i + 1, len(analysis.Group), f'Processing {obj.TypeId}...'):
+            if not progress_callback(done, total, f'Processing {type_id}...'):
                 log_message('INFO', 'Nodeset extraction cancelled by user')
-                return ""
+                return False
+        return True
+    
+    # The extractors run one after the other on the calling thread, they read the References
+    # and Shapes of live document objects. Only the distance checks of _nodes_on_shape run
+    # in a thread pool, on shapes that are already resolved.
+    nodesets = extract_all_nodesets(analysis, mesh_obj, CONSTRAINT_EXTRACTORS, report)
+    if nodesets is None:
+        return ""
     
     if not nodesets:
         log_message('WARNING', 'No nodesets were extracted from constraints')
@@ -273,9 +431,7 @@ def extract_nodesets(analysis, mesh_obj, create_text_object=False, progress_call
     for name, nodes in nodesets.items():
         result.append(f"$NODESET/{name}")
         # Write nodes in chunks of 10 for better readability
-        for i in range(0, len(nodes), 10):
-            chunk = nodes[i:i+10]
-            result.append(" ".join(map(str, chunk)))
+        result.extend(_node_lines(nodes, 10))
         result.append("")
     
     return "\n".join(result)
\ No newline at end of file
@@ -25,6 +25,10 @@ __title__ = "FreeCAD FEM calculix constraint contact"
 __author__ = "Bernd Hahnebach"
 __url__ = "https://www.freecad.org"
 
+from collections import defaultdict
+
+from .nodeset_utils import add_element_nodes
+
 
 def get_analysis_types():
     return "all"  # write for all analysis types
@@ -64,7 +68,8 @@ def extract_nodesets(analysis, mesh_obj):
     Returns:
         dict: Dictionary with nodeset name as key and node IDs as value
     """
-    nodesets = {}
+    # node IDs of each nodeset, joined into a string once at the end
+    nodesets = defaultdict(set)
     
     # Find all contact constraints in the analysis
     contact_constraints = [obj for obj in analysis.Group 
@@ -78,39 +83,25 @@ def extract_nodesets(analysis, mesh_obj):
         
         # Get nodes from the master references
         if hasattr(constraint, 'References') and constraint.References:
-            master_node_ids = []
+            master_node_ids = nodesets[master_nodeset]
             for (obj, elem) in constraint.References:
                 if hasattr(obj, 'getNodeByEdge'):
                     # Get nodes from edges/faces/vertices
-                    for e in elem:
-                        if 'Edge' in e:
-                            master_node_ids.extend(obj.getNodeByEdge(e))
-                        elif 'Face' in e:
-                            master_node_ids.extend(obj.getNodeByFace(e))
-                        elif 'Vertex' in e:
-                            master_node_ids.append(obj.getNodeByVertex(e))
-            
-            if master_node_ids:
-                nodesets[master_nodeset] = ",".join(map(str, sorted(set(master_node_ids))))
+                    add_element_nodes(obj, elem, master_node_ids)
         
         # Get nodes from the slave references if they exist
         if hasattr(constraint, 'SlaveRef'):
-            slave_node_ids = []
+            slave_node_ids = nodesets[slave_nodeset]
             for (obj, elem) in constraint.SlaveRef:
                 if hasattr(obj, 'getNodeByEdge'):
                     # Get nodes from edges/faces/vertices
-                    for e in elem:
-                        if 'Edge' in e:
-                            slave_node_ids.extend(obj.getNodeByEdge(e))
-                        elif 'Face' in e:
-                            slave_node_ids.extend(obj.getNodeByFace(e))
-                        elif 'Vertex' in e:
-                            slave_node_ids.append(obj.getNodeByVertex(e))
-            
-            if slave_node_ids:
-                nodesets[slave_nodeset] = ",".join(map(str, sorted(set(slave_node_ids))))
+                    add_element_nodes(obj, elem, slave_node_ids)
     
-    return nodesets
+    return {
+        name: ",".join(map(str, sorted(node_ids)))
+        for name, node_ids in nodesets.items()
+        if node_ids
+    }
 
 
 def write_meshdata_constraint(f, femobj, contact_obj, ORwriter):
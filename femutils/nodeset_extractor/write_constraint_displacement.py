@@ -25,8 +25,12 @@ __title__ = "FreeCAD FEM calculix constraint displacement"
 __author__ = "Bernd Hahnebach"
 __url__ = "https://www.freecad.org"
 
+from collections import defaultdict
+
 import FreeCAD
 
+from .nodeset_utils import add_element_nodes
+
 
 def get_analysis_types():
     return "all"  # write for all analysis types
@@ -72,7 +76,8 @@ def extract_nodesets(analysis, mesh_obj):
     Returns:
         dict: Dictionary with nodeset name as key and node IDs as value
     """
-    nodesets = {}
+    # node IDs of each nodeset, joined into a string once at the end
+    nodesets = defaultdict(set)
     
     # Find all displacement constraints in the analysis
     disp_constraints = [obj for obj in analysis.Group 
@@ -83,22 +88,17 @@ def extract_nodesets(analysis, mesh_obj):
         
         # Get nodes from the constraint references
         if hasattr(constraint, 'References') and constraint.References:
-            node_ids = []
+            node_ids = nodesets[nodeset_name]
             for (obj, elem) in constraint.References:
                 if hasattr(obj, 'getNodeByEdge'):
                     # Get nodes from edges/faces/vertices
-                    for e in elem:
-                        if 'Edge' in e:
-                            node_ids.extend(obj.getNodeByEdge(e))
-                        elif 'Face' in e:
-                            node_ids.extend(obj.getNodeByFace(e))
-                        elif 'Vertex' in e:
-                            node_ids.append(obj.getNodeByVertex(e))
-            
-            if node_ids:
-                nodesets[nodeset_name] = ",".join(map(str, sorted(set(node_ids))))
+                    add_element_nodes(obj, elem, node_ids)
     
-    return nodesets
+    return {
+        name: ",".join(map(str, sorted(node_ids)))
+        for name, node_ids in nodesets.items()
+        if node_ids
+    }
 
 
 def write_constraint(f, femobj, disp_obj, ORwriter):
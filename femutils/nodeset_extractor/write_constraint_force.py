@@ -42,83 +42,6 @@ def get_after_write_meshdata_constraint():
     return ""
 
 
-def extract_nodes_from_references(references, mesh_obj, log_prefix=""):
-    """Extract node IDs from geometry references using the mesh object.
-    
-    Args:
-        references: List of (object, element_list) tuples from constraint.References
-        mesh_obj: The FEM mesh object
-        log_prefix: Optional prefix for log messages
-        
-    Returns:
-        set: Set of node IDs that correspond to the geometry references
-    """
-    if not references:
-        print(f"{log_prefix}[WARNING] No references provided")
-        return set()
-        
-    if not hasattr(mesh_obj, 'FemMesh'):
-        print(f"{log_prefix}[ERROR] Mesh object has no FemMesh attribute")
-        return set()
-        
-    fem_mesh = mesh_obj.FemMesh
-    node_ids = set()
-    
-    for ref_idx, (part_obj, elem_list) in enumerate(references):
-        print(f"{log_prefix}[DEBUG] Processing reference {ref_idx}: {part_obj.Name if hasattr(part_obj, 'Name') else part_obj}, elements: {elem_list}")
-        
-        if not hasattr(part_obj, 'Shape'):
-            print(f"{log_prefix}[WARNING] Reference object has no Shape attribute")
-            continue
-            
-        # Get the part object that defines the constraint
-        part_shape = part_obj.Shape
-        
-        # If no specific elements are provided, use the whole shape
-        if not elem_list:
-            print(f"{log_prefix}[DEBUG] No elements specified, using entire shape")
-            element_nodes = extract_nodes_from_geometry(part_shape, mesh_obj, log_prefix=log_prefix)
-            node_ids.update(element_nodes)
-            continue
-            
-        # Process each element in the reference
-        for elem in elem_list:
-            try:
-                # Get the sub-element (face, edge, or vertex)
-                element = part_shape.getElement(elem)
-                
-                # Extract nodes from this element with proper tolerance checking
-                element_nodes = extract_nodes_from_geometry(element, mesh_obj, log_prefix=f"{log_prefix}[{elem}] ")
-                node_ids.update(element_nodes)
-                
-            except Exception as e:
-                print(f"{log_prefix}[ERROR] Error processing element {elem}: {str(e)}")
-                print(f"{log_prefix}[DEBUG] {traceback.format_exc()}")
-                
-                # Fallback to the old method if the new one fails
-                try:
-                    print(f"{log_prefix}[DEBUG] Falling back to legacy node extraction for {elem}")
-                    element = part_shape.getElement(elem)
-                    element_nodes = set()
-                    
-                    # Bounding box check first for performance
-                    bbox = element.BoundBox
-                    bbox.enlarge(1e-6)  # Small tolerance for floating point inaccuracies
-                    
-                    for node_id, node in fem_mesh.Nodes.items():
-                        if bbox.isInside(Vector(node)):
-                            if element.distToShape(Part.Vertex(node))[0] < 1e-6:
-                                element_nodes.add(node_id)
-                    
-                    node_ids.update(element_nodes)
-                    print(f"{log_prefix}[DEBUG] Legacy method found {len(element_nodes)} nodes for {elem}")
-                    
-                except Exception as e2:
-                    print(f"{log_prefix}[ERROR] Legacy method also failed for {elem}: {str(e2)}")
-    
-    print(f"{log_prefix}[DEBUG] Found {len(node_ids)} total nodes from references")
-    return node_ids
-
 def extract_nodesets(analysis, mesh_obj):
     """Extract force constraint nodesets from the analysis.
     
@@ -129,6 +52,8 @@ def extract_nodesets(analysis, mesh_obj):
     Returns:
         dict: Dictionary with nodeset name as key and node IDs as value
     """
+    from .nodeset_utils import extract_nodes_from_references
+    
     nodesets = {}
     
     # Find all force constraints in the analysis
@@ -25,6 +25,10 @@ __title__ = "FreeCAD FEM calculix constraint heatflux"
 __author__ = "Bernd Hahnebach"
 __url__ = "https://www.freecad.org"
 
+from collections import defaultdict
+
+from .nodeset_utils import add_element_nodes
+
 
 def get_analysis_types():
     return ["thermomech"]
@@ -52,7 +56,8 @@ def extract_nodesets(analysis, mesh_obj):
     Returns:
         dict: Dictionary with nodeset name as key and node IDs as value
     """
-    nodesets = {}
+    # node IDs of each nodeset, joined into a string once at the end
+    nodesets = defaultdict(set)
     
     # Find all heat flux constraints in the analysis
     heatflux_constraints = [obj for obj in analysis.Group 
@@ -64,23 +69,17 @@ def extract_nodesets(analysis, mesh_obj):
         
         # Get nodes from the constraint references
         if hasattr(constraint, 'References') and constraint.References:
-            node_ids = []
+            node_ids = nodesets[nodeset_name]
             for (obj, elem) in constraint.References:
                 if hasattr(obj, 'getNodeByEdge'):
                     # Get nodes from edges/faces/vertices
-                    for e in elem:
-                        if 'Edge' in e:
-                            node_ids.extend(obj.getNodeByEdge(e))
-                        elif 'Face' in e:
-                            # For heat flux constraints, we typically want the face nodes
-                            node_ids.extend(obj.getNodeByFace(e))
-                        elif 'Vertex' in e:
-                            node_ids.append(obj.getNodeByVertex(e))
-            
-            if node_ids:
-                nodesets[nodeset_name] = ",".join(map(str, sorted(set(node_ids))))
+                    add_element_nodes(obj, elem, node_ids)
     
-    return nodesets
+    return {
+        name: ",".join(map(str, sorted(node_ids)))
+        for name, node_ids in nodesets.items()
+        if node_ids
+    }
 
 
 def write_meshdata_constraint(f, femobj, heatflux_obj, ORwriter):
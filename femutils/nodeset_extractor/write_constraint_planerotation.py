@@ -26,8 +26,12 @@ __author__ = "Bernd Hahnebach"
 __url__ = "https://www.freecad.org"
 
 
+from collections import defaultdict
+
 from femmesh import meshtools
 
+from .nodeset_utils import add_element_nodes
+
 
 def get_analysis_types():
     return "all"  # write for all analysis types
@@ -67,7 +71,8 @@ def extract_nodesets(analysis, mesh_obj):
     Returns:
         dict: Dictionary with nodeset name as key and node IDs as value
     """
-    nodesets = {}
+    # node IDs of each nodeset, ordered for the plane once at the end
+    nodesets = defaultdict(set)
     
     # Find all planerotation constraints in the analysis
     planerotation_constraints = [obj for obj in analysis.Group 
@@ -79,39 +84,39 @@ def extract_nodesets(analysis, mesh_obj):
         
         # Get nodes from the constraint references
         if hasattr(constraint, 'References') and constraint.References:
-            node_ids = []
+            node_ids = nodesets[nodeset_name]
             for (obj, elem) in constraint.References:
                 if hasattr(obj, 'getNodeByEdge'):
                     # Get nodes from edges/faces/vertices
-                    for e in elem:
-                        if 'Edge' in e:
-                            node_ids.extend(obj.getNodeByEdge(e))
-                        elif 'Face' in e:
-                            node_ids.extend(obj.getNodeByFace(e))
-                        elif 'Vertex' in e:
-                            node_ids.append(obj.getNodeByVertex(e))
-            
-            if node_ids:
-                # For planerotation constraints, we need to ensure we have enough nodes
-                # to define a plane (at least 3 non-collinear nodes)
-                if len(node_ids) >= 3:
-                    # Get the actual node coordinates for planarity check
-                    nodes_coords = []
-                    for node_id in node_ids:
-                        node = mesh_obj.FemMesh.Nodes[node_id]
-                        nodes_coords.append((node_id, node.x, node.y, node.z))
-                    
-                    # Get three non-collinear nodes to define the plane
-                    plane_nodes = meshtools.get_three_non_colinear_nodes(nodes_coords)
-                    
-                    # Add any additional nodes that weren't included in the plane definition
-                    for node_id in node_ids:
-                        if node_id not in plane_nodes:
-                            plane_nodes.append(node_id)
-                    
-                    nodesets[nodeset_name] = ",".join(map(str, sorted(plane_nodes)))
+                    add_element_nodes(obj, elem, node_ids)
+    
+    plane_nodesets = {}
+    mesh_nodes = None
+    for name, node_ids in nodesets.items():
+        # For planerotation constraints, we need to ensure we have enough nodes
+        # to define a plane (at least 3 non-collinear nodes)
+        if len(node_ids) < 3:
+            continue
+        if mesh_nodes is None:
+            # Get the actual node coordinates for planarity check
+            # FemMesh.Nodes builds a new dict on every access, get it once
+            mesh_nodes = mesh_obj.FemMesh.Nodes
+        nodes_coords = []
+        for node_id in node_ids:
+            node = mesh_nodes[node_id]
+            nodes_coords.append((node_id, node.x, node.y, node.z))
+        
+        # Get three non-collinear nodes to define the plane
+        plane_nodes = meshtools.get_three_non_colinear_nodes(nodes_coords)
+        
+        # Add any additional nodes that weren't included in the plane definition
+        for node_id in node_ids:
+            if node_id not in plane_nodes:
+                plane_nodes.append(node_id)
+        
+        plane_nodesets[name] = ",".join(map(str, sorted(plane_nodes)))
     
-    return nodesets
+    return plane_nodesets
 
 
 def write_meshdata_constraint(f, femobj, fric_obj, ORwriter):
@@ -25,8 +25,12 @@ __title__ = "FreeCAD FEM calculix constraint pressure"
 __author__ = "Bernd Hahnebach"
 __url__ = "https://www.freecad.org"
 
+from collections import defaultdict
+
 import FreeCAD
 
+from .nodeset_utils import add_element_nodes
+
 
 def get_analysis_types():
     return ["buckling", "static", "thermomech"]
@@ -54,7 +58,8 @@ def extract_nodesets(analysis, mesh_obj):
     Returns:
         dict: Dictionary with nodeset name as key and node IDs as value
     """
-    nodesets = {}
+    # node IDs of each nodeset, joined into a string once at the end
+    nodesets = defaultdict(set)
     
     # Find all pressure constraints in the analysis
     pressure_constraints = [obj for obj in analysis.Group 
@@ -66,23 +71,17 @@ def extract_nodesets(analysis, mesh_obj):
         
         # Get nodes from the constraint references
         if hasattr(constraint, 'References') and constraint.References:
-            node_ids = []
+            node_ids = nodesets[nodeset_name]
             for (obj, elem) in constraint.References:
                 if hasattr(obj, 'getNodeByEdge'):
                     # Get nodes from edges/faces/vertices
-                    for e in elem:
-                        if 'Edge' in e:
-                            node_ids.extend(obj.getNodeByEdge(e))
-                        elif 'Face' in e:
-                            # For pressure constraints, we typically want the face nodes
-                            node_ids.extend(obj.getNodeByFace(e))
-                        elif 'Vertex' in e:
-                            node_ids.append(obj.getNodeByVertex(e))
-            
-            if node_ids:
-                nodesets[nodeset_name] = ",".join(map(str, sorted(set(node_ids))))
+                    add_element_nodes(obj, elem, node_ids)
     
-    return nodesets
+    return {
+        name: ",".join(map(str, sorted(node_ids)))
+        for name, node_ids in nodesets.items()
+        if node_ids
+    }
 
 
 def write_meshdata_constraint(f, femobj, prs_obj, ORwriter):
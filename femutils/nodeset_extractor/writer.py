@@ -226,6 +226,10 @@ def extract_nodesets(analysis, mesh_obj, create_text_object=False, progress_call
     print(f"[NODESET] Extracting nodesets for mesh: {mesh_obj.Name if mesh_obj else 'None'}")
     
     try:
+        # the mesh may have changed since the last extraction
+        from .nodeset_utils import clear_mesh_cache
+        clear_mesh_cache()
+        
         # Import all constraint writer modules
         from .write_constraint_fixed import extract_nodesets as extract_fixed_nodesets
         from .write_constraint_displacement import extract_nodesets as extract_displacement_nodesets